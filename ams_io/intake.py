@@ -3,45 +3,199 @@ Intake utilities for staging and classifying incoming sources.
 """
 from __future__ import annotations
 
+import os
 import shutil
+import stat
+import subprocess
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Tuple
 
+import numpy as np
 import py7zr
 
 
+CATEGORIES = ("models", "textures", "scripts", "other")
+
+
+def _unpack_paths(blob: bytes, spans: np.ndarray) -> List[Path]:
+    return [Path(os.fsdecode(blob[start:end])) for start, end in spans.tolist()]
+
+
 @dataclass
 class IntakeSummary:
+    """Intake classification stored column-wise.
+
+    All file paths live in one encoded blob; offsets[category] is an (N, 2)
+    int64 array of (start, end) byte ranges into it. Path objects are only
+    built on demand through paths() / files_by_type.
+    """
     staged_path: Path
     counts: Dict[str, int]
-    files_by_type: Dict[str, List[Path]]
+    paths_blob: bytes
+    offsets: Dict[str, np.ndarray]
+
+    def paths(self, category: str) -> List[Path]:
+        return _unpack_paths(self.paths_blob, self.offsets[category])
+
+    @property
+    def files_by_type(self) -> Dict[str, List[Path]]:
+        return {k: self.paths(k) for k in self.offsets}
 
 
-ARCHIVE_EXTS = {".zip", ".7z"}
-MODEL_EXTS = {".obj", ".fbx", ".dae", ".stl", ".ply", ".gltf", ".glb"}
-TEXTURE_EXTS = {".png", ".jpg", ".jpeg", ".tga", ".bmp", ".tiff", ".dds"}
-SCRIPT_EXTS = {".cfg", ".ini", ".txt", ".json", ".lua", ".xml"}
+ARCHIVE_EXTS = frozenset({".zip", ".7z"})
+MODEL_EXTS = frozenset({".obj", ".fbx", ".dae", ".stl", ".ply", ".gltf", ".glb"})
+TEXTURE_EXTS = frozenset({".png", ".jpg", ".jpeg", ".tga", ".bmp", ".tiff", ".dds"})
+SCRIPT_EXTS = frozenset({".cfg", ".ini", ".txt", ".json", ".lua", ".xml"})
+
+# Extension -> category in one dict lookup. Later entries override earlier ones, so on
+# overlap models > textures > scripts, the precedence of the old if/elif chain.
+_EXT_CATEGORY: Dict[str, str] = {
+    **{ext: "scripts" for ext in SCRIPT_EXTS},
+    **{ext: "textures" for ext in TEXTURE_EXTS},
+    **{ext: "models" for ext in MODEL_EXTS},
+}
+
+# Native 7-Zip is much faster than py7zr (multi-threaded LZMA); py7zr stays as fallback
+SEVEN_ZIP_BIN = shutil.which("7z") or shutil.which("7zz")
 
 
 def is_supported_archive(path: Path) -> bool:
     return path.suffix.lower() in ARCHIVE_EXTS
 
 
+_EXTRACT_BUF_SIZE = 1 << 20
+
+
+def _zip_member_target(dest: str, name: str) -> str:
+    # Same sanitising as ZipFile.extract: drop drive letters, empty, '.' and '..'
+    # components so entries can never escape dest.
+    name = os.path.splitdrive(name.replace('\\', '/'))[1]
+    parts = [p for p in name.split('/') if p not in ('', '.', '..')]
+    return os.path.join(dest, *parts)
+
+
+def _extract_zip_members(archive: Path, members: List[Tuple[zipfile.ZipInfo, str]]) -> None:
+    # Each worker opens its own ZipFile handle; entries are independently
+    # decompressible from their local header offsets.
+    buf = bytearray(_EXTRACT_BUF_SIZE)
+    view = memoryview(buf)
+    with zipfile.ZipFile(archive, "r") as zf:
+        for info, target in members:
+            with zf.open(info) as src, open(target, "wb", buffering=0) as dst:
+                while n := src.readinto(buf):
+                    dst.write(view[:n])
+
+
+def _extract_zip(archive: Path, dest: Path) -> None:
+    root = os.fspath(dest)
+    files: List[Tuple[zipfile.ZipInfo, str]] = []
+    with zipfile.ZipFile(archive, "r") as zf:
+        infos = zf.infolist()
+    # Create all directories up front so the workers never race on makedirs
+    for info in infos:
+        target = _zip_member_target(root, info.filename)
+        if target == root:
+            continue
+        if info.is_dir():
+            os.makedirs(target, exist_ok=True)
+        else:
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            files.append((info, target))
+
+    # zlib/bz2/lzma release the GIL while decompressing, so threads scale
+    workers = min(os.cpu_count() or 1, len(files))
+    if workers <= 1:
+        _extract_zip_members(archive, files)
+        return
+    shards = [files[i::workers] for i in range(workers)]
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        list(ex.map(lambda shard: _extract_zip_members(archive, shard), shards))
+
+
 def extract_archive(archive: Path, dest: Path) -> Path:
     dest.mkdir(parents=True, exist_ok=True)
     if archive.suffix.lower() == ".zip":
-        with zipfile.ZipFile(archive, "r") as zf:
-            zf.extractall(dest)
+        _extract_zip(archive, dest)
     elif archive.suffix.lower() == ".7z":
-        with py7zr.SevenZipFile(archive, "r") as z:
-            z.extractall(path=dest)
+        if SEVEN_ZIP_BIN:
+            subprocess.run(
+                [SEVEN_ZIP_BIN, "x", str(archive), f"-o{dest}", "-y", "-bd", "-mmt=on"],
+                check=True,
+                stdout=subprocess.DEVNULL,
+                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+            )
+        else:
+            with py7zr.SevenZipFile(archive, "r") as z:
+                z.extractall(path=dest)
     else:
         raise ValueError(f"Unsupported archive type: {archive.suffix}")
     return dest
 
 
+def _copy_file_fast(src: str, dst: str, st: os.stat_result) -> None:
+    # copyfile uses the platform fast path (sendfile/copy_file_range, fcopyfile,
+    # or the 1 MiB Windows loop); only mode and timestamps are carried over.
+    shutil.copyfile(src, dst)
+    os.chmod(dst, st.st_mode & 0o7777)
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+_COPY_WORKERS = 8
+_COPY_CHUNK = 64
+
+
+def _mirror_dirs(src: str, dst: str, jobs: List[Tuple[str, str, os.stat_result]]) -> None:
+    """Create the directory skeleton of src under dst and collect the file copies to run.
+
+    Symlinks are never descended into (a link loop can't recurse): a link to a
+    directory becomes an empty directory and a link to a file is copied as that
+    file's contents, as the earlier rglob-based copy did. Dangling links are skipped.
+    """
+    with os.scandir(src) as it:
+        for entry in it:
+            target = os.path.join(dst, entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                os.mkdir(target)
+                _mirror_dirs(entry.path, target, jobs)
+            elif entry.is_symlink():
+                try:
+                    st = entry.stat()  # the link target
+                except OSError:
+                    continue
+                if stat.S_ISDIR(st.st_mode):
+                    os.mkdir(target)
+                else:
+                    jobs.append((entry.path, target, st))
+            else:
+                jobs.append((entry.path, target, entry.stat()))
+
+
+def _copy_chunk(chunk: List[Tuple[str, str, os.stat_result]]) -> None:
+    for src, dst, st in chunk:
+        _copy_file_fast(src, dst, st)
+
+
+def _copy_tree_fast(src: str, dst: str) -> None:
+    """Recursively copy src into the existing directory dst.
+
+    Directories are created sequentially first; the file copies then run on
+    a small thread pool since the kernel copy calls release the GIL.
+    """
+    jobs: List[Tuple[str, str, os.stat_result]] = []
+    _mirror_dirs(src, dst, jobs)
+    chunks = [jobs[i:i + _COPY_CHUNK] for i in range(0, len(jobs), _COPY_CHUNK)]
+    if len(chunks) <= 1:
+        for chunk in chunks:
+            _copy_chunk(chunk)
+        return
+    with ThreadPoolExecutor(max_workers=min(_COPY_WORKERS, len(chunks))) as ex:
+        # list() re-raises the first copy error, if any
+        list(ex.map(_copy_chunk, chunks))
+
+
 def stage_source(src: Path, workspace_root: Path, source_name: str | None = None) -> Path:
     workspace_root.mkdir(parents=True, exist_ok=True)
     if source_name is None:
@@ -53,46 +207,104 @@ def stage_source(src: Path, workspace_root: Path, source_name: str | None = None
 
     if src.is_dir():
         # Copy directory tree
-        for item in src.rglob("*"):
-            rel = item.relative_to(src)
-            dst = target / rel
-            if item.is_dir():
-                dst.mkdir(parents=True, exist_ok=True)
-            else:
-                dst.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(item, dst)
+        _copy_tree_fast(os.fspath(src), os.fspath(target))
     elif src.is_file() and is_supported_archive(src):
         extract_archive(src, target)
     else:
         # Single file scenario: copy into target root
-        shutil.copy2(src, target / src.name)
+        _copy_file_fast(os.fspath(src), os.fspath(target / src.name), src.stat())
 
     return target
 
 
-def sniff_content(root: Path) -> Tuple[Dict[str, List[Path]], Dict[str, int]]:
-    files_by_type: Dict[str, List[Path]] = {"models": [], "textures": [], "scripts": [], "other": []}
-    counts = {"models": 0, "textures": 0, "scripts": 0, "other": 0}
+def _ext_of(name: str) -> str:
+    # Same result as Path(name).suffix.lower() without building a Path
+    stem, _, ext = name.rpartition('.')
+    if not stem or not ext:
+        return ""
+    return '.' + ext.lower()
 
-    for p in root.rglob("*"):
-        if not p.is_file():
-            continue
-        ext = p.suffix.lower()
-        if ext in MODEL_EXTS:
-            files_by_type["models"].append(p)
-            counts["models"] += 1
-        elif ext in TEXTURE_EXTS:
-            files_by_type["textures"].append(p)
-            counts["textures"] += 1
-        elif ext in SCRIPT_EXTS:
-            files_by_type["scripts"].append(p)
-            counts["scripts"] += 1
-        else:
-            files_by_type["other"].append(p)
-            counts["other"] += 1
+
+def _walk(path: str) -> Iterator[os.DirEntry]:
+    """Yield regular files below path using cached scandir entries; symlinks are skipped."""
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_symlink():
+                continue
+            if entry.is_dir():
+                yield from _walk(entry.path)
+            elif entry.is_file():
+                yield entry
+
+
+class _PathColumns:
+    """Accumulates classified paths of one walk as encoded bytes plus flat span lists."""
+
+    __slots__ = ("blob", "spans")
+
+    def __init__(self) -> None:
+        self.blob = bytearray()
+        self.spans: Dict[str, List[int]] = {k: [] for k in CATEGORIES}
+
+    def add(self, entry: os.DirEntry) -> None:
+        category = _EXT_CATEGORY.get(_ext_of(entry.name), "other")
+        start = len(self.blob)
+        self.blob += os.fsencode(entry.path)
+        spans = self.spans[category]
+        spans.append(start)
+        spans.append(len(self.blob))
+
+    def merge(self, other: "_PathColumns") -> None:
+        base = len(self.blob)
+        self.blob += other.blob
+        for k in CATEGORIES:
+            self.spans[k].extend(x + base for x in other.spans[k])
+
+
+def _walk_shard(path: str) -> _PathColumns:
+    # Each worker fills its own columns, so no locking is needed
+    cols = _PathColumns()
+    for entry in _walk(path):
+        cols.add(entry)
+    return cols
+
+
+def pack_content(root: Path) -> Tuple[bytes, Dict[str, np.ndarray]]:
+    """Classify files below root into (paths_blob, offsets) columns; see IntakeSummary."""
+    cols = _PathColumns()
+    subdirs: List[str] = []
+    with os.scandir(os.fspath(root)) as it:
+        for entry in it:
+            if entry.is_symlink():
+                continue
+            if entry.is_dir():
+                subdirs.append(entry.path)
+            elif entry.is_file():
+                cols.add(entry)
+
+    # Directory listing is syscall-bound and scandir releases the GIL,
+    # so top-level subtrees are walked concurrently.
+    if len(subdirs) > 1:
+        workers = min(os.cpu_count() or 1, 8, len(subdirs))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            shards = list(ex.map(_walk_shard, subdirs))
+    else:
+        shards = [_walk_shard(d) for d in subdirs]
+    for shard in shards:
+        cols.merge(shard)
+
+    offsets = {k: np.asarray(v, dtype=np.int64).reshape(-1, 2) for k, v in cols.spans.items()}
+    return bytes(cols.blob), offsets
+
+
+def sniff_content(root: Path) -> Tuple[Dict[str, List[Path]], Dict[str, int]]:
+    blob, offsets = pack_content(root)
+    files_by_type = {k: _unpack_paths(blob, v) for k, v in offsets.items()}
+    counts = {k: len(v) for k, v in offsets.items()}
     return files_by_type, counts
 
 
 def compute_intake_summary(staged_path: Path) -> IntakeSummary:
-    files_by_type, counts = sniff_content(staged_path)
-    return IntakeSummary(staged_path=staged_path, counts=counts, files_by_type=files_by_type)
+    blob, offsets = pack_content(staged_path)
+    counts = {k: len(v) for k, v in offsets.items()}
+    return IntakeSummary(staged_path=staged_path, counts=counts, paths_blob=blob, offsets=offsets)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import multiprocessing
 import sys
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QApplication
@@ -19,4 +20,5 @@ def main() -> int:
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # process pools in the frozen (PyInstaller) build
     raise SystemExit(main())
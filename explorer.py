@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import os
+import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from PyQt6.QtCore import Qt, QModelIndex, QPoint
+from PyQt6.QtCore import Qt, QModelIndex, QPersistentModelIndex, QPoint, QTimer
 from PyQt6.QtGui import QDesktopServices
 from PyQt6.QtWidgets import (
     QWidget,
@@ -20,9 +23,23 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import QUrl, QSortFilterProxyModel
 
 
-IMAGE_EXTS = {".png", ".jpg", ".jpeg", ".tga", ".bmp", ".tiff", ".gif"}
-MODEL_EXTS = {".obj", ".fbx", ".dae", ".stl", ".ply", ".gltf", ".glb"}
-TEXT_EXTS = {".cfg", ".ini", ".txt", ".json", ".yaml", ".yml", ".xml"}
+IMAGE_EXTS = frozenset({".png", ".jpg", ".jpeg", ".tga", ".bmp", ".tiff", ".gif"})
+MODEL_EXTS = frozenset({".obj", ".fbx", ".dae", ".stl", ".ply", ".gltf", ".glb"})
+TEXT_EXTS = frozenset({".cfg", ".ini", ".txt", ".json", ".yaml", ".yml", ".xml"})
+
+
+@lru_cache(maxsize=256)
+def list_siblings(parent: str) -> frozenset[str]:
+    """Names in a directory, listed once with scandir and cached.
+
+    Used for sidecar lookups instead of one exists() per candidate; call
+    list_siblings.cache_clear() when the file system changes.
+    """
+    try:
+        with os.scandir(parent) as it:
+            return frozenset(entry.name for entry in it)
+    except OSError:
+        return frozenset()
 
 
 class ExplorerWidget(QWidget):
@@ -36,10 +53,18 @@ class ExplorerWidget(QWidget):
         super().__init__(parent)
         self._history: list[Path] = []
         self._future: list[Path] = []
+        # Last hovered source index and the tooltip html for it (None when not an image)
+        self._hover_cache: Optional[tuple[QPersistentModelIndex, Optional[str]]] = None
 
         self._model = QFileSystemModel(self)
         self._model.setOption(QFileSystemModel.Option.DontWatchForChanges, False)
+        # Per-folder custom icons (desktop.ini etc.) cost a lookup per directory; plain folder icons are enough
+        self._model.setOption(QFileSystemModel.Option.DontUseCustomDirectoryIcons, True)
         self._model.setRootPath(str(root or Path.home()))
+        # The model's file watcher reports added/removed/renamed entries; drop cached listings
+        self._model.rowsInserted.connect(lambda *_: list_siblings.cache_clear())
+        self._model.rowsRemoved.connect(lambda *_: list_siblings.cache_clear())
+        self._model.fileRenamed.connect(lambda *_: list_siblings.cache_clear())
 
         # Filter proxy for name filtering
         self._proxy = QSortFilterProxyModel(self)
@@ -80,6 +105,11 @@ class ExplorerWidget(QWidget):
         self._path_edit.returnPressed.connect(self._on_path_entered)
         self._search_edit = QLineEdit()
         self._search_edit.setPlaceholderText("Search…")
+        # Debounce: re-filtering makes QFileSystemModel stat entries, so wait for a typing pause
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(180)
+        self._search_timer.timeout.connect(self._apply_search)
         self._search_edit.textChanged.connect(self._on_search_changed)
         nav.addWidget(self._back_btn)
         nav.addWidget(self._fwd_btn)
@@ -95,6 +125,15 @@ class ExplorerWidget(QWidget):
         self.setLayout(layout)
 
     def _detect_drives(self) -> list[str]:
+        if sys.platform == "win32":
+            # One GetLogicalDrives() bitmask instead of 26 exists() probes
+            try:
+                import ctypes
+                mask = ctypes.windll.kernel32.GetLogicalDrives()  # type: ignore[attr-defined]
+            except Exception:
+                mask = 0
+            if mask:
+                return [f"{chr(ord('A') + i)}:/" for i in range(26) if mask & (1 << i)]
         drives = []
         for ch in map(chr, range(ord('A'), ord('Z') + 1)):
             p = Path(f"{ch}:/")
@@ -143,6 +182,13 @@ class ExplorerWidget(QWidget):
         self._navigate_to(Path(self._path_edit.text()))
 
     def _on_search_changed(self, text: str) -> None:
+        self._search_timer.start()
+
+    def _apply_search(self) -> None:
+        text = self._search_edit.text()
+        # The file watcher stays on (it keeps list_siblings fresh); while a filter is
+        # active only the proxy's re-sort/re-filter on every model change is suspended
+        self._proxy.setDynamicSortFilter(not text)
         self._proxy.setFilterFixedString(text)
 
     def set_root(self, path: Path) -> None:
@@ -197,10 +243,9 @@ class ExplorerWidget(QWidget):
             act_vs.triggered.connect(lambda: self.parent().validate_schema_action(path))
 
             # View Manifest
-            sidecar_json = Path(str(path) + ".ams.json")
-            sidecar_yaml = Path(str(path) + ".ams.yaml")
+            siblings = list_siblings(str(path.parent))
             is_manifest_file = path.name.endswith('.ams.json') or path.name.endswith('.ams.yaml')
-            if is_manifest_file or sidecar_json.exists() or sidecar_yaml.exists():
+            if is_manifest_file or f"{path.name}.ams.json" in siblings or f"{path.name}.ams.yaml" in siblings:
                 act_view = menu.addAction("View Manifest…")
                 act_view.triggered.connect(lambda: self.parent().view_manifest_action(path))
 
@@ -231,11 +276,23 @@ class ExplorerWidget(QWidget):
             idx = self._view.indexAt(pos)
             if idx.isValid():
                 src_idx = self._proxy.mapToSource(idx)
-                path = Path(self._model.filePath(src_idx))
-                if path.is_file() and path.suffix.lower() in IMAGE_EXTS:
-                    url = QUrl.fromLocalFile(str(path))
-                    html = f"<b>{path.name}</b><br><img src='{url.toString()}' width='256'>"
+                cached = self._hover_cache
+                if cached is not None and cached[0] == src_idx:
+                    # Same item as the previous move event: reuse the result
+                    html = cached[1]
+                else:
+                    html = None
+                    # isDir() uses the model's cached file info, so no stat() per move
+                    if not self._model.isDir(src_idx):
+                        path = Path(self._model.filePath(src_idx))
+                        if path.suffix.lower() in IMAGE_EXTS:
+                            url = QUrl.fromLocalFile(str(path))
+                            html = f"<b>{path.name}</b><br><img src='{url.toString()}' width='256'>"
+                    self._hover_cache = (QPersistentModelIndex(src_idx), html)
+                if html is not None:
                     QToolTip.showText(self._view.mapToGlobal(pos), html, self._view)
                 else:
                     QToolTip.hideText()
+            else:
+                self._hover_cache = None
         return super().eventFilter(obj, event)
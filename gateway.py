@@ -6,12 +6,18 @@ from __future__ import annotations
 
 import os
 from functools import wraps
-from typing import Callable
+from typing import Any, Callable
 
 from flask import Flask, jsonify, request
+from flask.json.provider import JSONProvider
 
 from validators import CfgValidator
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
 
 VERSION = "0.1.0"
 
@@ -28,8 +34,22 @@ def require_token(token: str):
     return decorator
 
 
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson for request parsing and jsonify."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
 def create_app(token: str) -> Flask:
     app = Flask(__name__)
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
+    # Rules keep no per-call state, so one validator serves every request
+    validator = CfgValidator()
 
     @app.get("/health")
     def health():
@@ -44,7 +64,6 @@ def create_app(token: str) -> Flask:
     def validate_text():
         data = request.get_json(silent=True) or {}
         text = data.get("text", "")
-        validator = CfgValidator()
         result = validator.validate(text)
         return jsonify({
             "ok": result.is_ok,
@@ -68,8 +87,16 @@ def start() -> None:
     host = "127.0.0.1"
     port = int(os.environ.get("AMS_GATEWAY_PORT", "8787"))
     app = create_app(token)
-    # No debug, local-only
-    app.run(host=host, port=port, debug=False)
+    try:
+        from waitress import serve  # type: ignore
+    except ImportError:
+        serve = None
+    if serve is not None:
+        # Production WSGI server: a worker thread pool handles concurrent /validate calls
+        serve(app, host=host, port=port, threads=8, connection_limit=64)
+    else:
+        # No debug, local-only; threaded so parallel requests don't queue behind each other
+        app.run(host=host, port=port, debug=False, threaded=True)
 
 
 if __name__ == "__main__":
@@ -3,38 +3,107 @@ Geometry primitives and exporters for part creation.
 """
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 import numpy as np
 import trimesh
+from trimesh.exchange.gltf import export_glb
+
+from metadata.utils import write_bytes_atomic
+
+
+# Constructors are memoized on their (hashable) parameters; the public helpers
+# always hand out a copy so callers can mutate meshes without aliasing the cache.
+
+@lru_cache(maxsize=64)
+def _box(extents: tuple[float, float, float]) -> trimesh.Trimesh:
+    return trimesh.creation.box(extents=extents)
+
+
+@lru_cache(maxsize=64)
+def _cylinder(radius: float, height: float, segments: int) -> trimesh.Trimesh:
+    return trimesh.creation.cylinder(radius=radius, height=height, sections=segments)
+
+
+@lru_cache(maxsize=64)
+def _unit_icosphere(subdivisions: int) -> trimesh.Trimesh:
+    return trimesh.creation.icosphere(subdivisions=subdivisions, radius=1.0)
+
+
+@lru_cache(maxsize=64)
+def _capsule_base(radius: float, count: int) -> trimesh.Trimesh:
+    # Zero-height capsule: the caps' rings with no body. No vertex sits at z == 0,
+    # so any height is this mesh with the upper half moved up and the lower half down.
+    return trimesh.creation.capsule(radius=radius, height=0.0, count=[count, count])
+
+
+@lru_cache(maxsize=64)
+def _torus(radius: float, tube_radius: float, sections: int, tube_sections: int) -> trimesh.Trimesh:
+    return trimesh.creation.torus(radius=radius, tube_radius=tube_radius, sections=sections, tube_sections=tube_sections)
 
 
 def create_box(size=(1.0, 1.0, 1.0)) -> trimesh.Trimesh:
-    return trimesh.creation.box(extents=size)
+    return _box(tuple(float(v) for v in size)).copy()
 
 
 def create_cylinder(radius=0.5, height=1.25, segments: int = 64) -> trimesh.Trimesh:
-    return trimesh.creation.cylinder(radius=radius, height=height, sections=segments)
+    return _cylinder(float(radius), float(height), int(segments)).copy()
 
 
 def create_sphere(radius=0.5, subdivisions: int = 3) -> trimesh.Trimesh:
-    return trimesh.creation.icosphere(subdivisions=subdivisions, radius=radius)
+    # Scaling the cached unit sphere is much cheaper than re-subdividing
+    mesh = _unit_icosphere(int(subdivisions)).copy()
+    mesh.apply_scale(float(radius))
+    return mesh
 
 
 def create_capsule(radius=0.5, height=1.0, count: int = 32) -> trimesh.Trimesh:
-    return trimesh.creation.capsule(radius=radius, height=height, count=count)
+    # Same vertices/faces as trimesh.creation.capsule(height=height), but the cap
+    # tessellation (all the trig) is computed once per (radius, count)
+    base = _capsule_base(float(radius), int(count))
+    vertices = base.vertices.copy()
+    z = vertices[:, 2]
+    z += np.copysign(float(height) / 2.0, z)
+    return trimesh.Trimesh(vertices=vertices, faces=base.faces.copy(), process=False)
+
+
+def create_capsule_batch(radii, heights, count: int = 32) -> list[trimesh.Trimesh]:
+    """create_capsule for each (radius, height) pair, in order.
+
+    Pairs sharing a radius are stretched from one cached base in a single
+    broadcast instead of one create_capsule call each.
+    """
+    radii = np.asarray(radii, dtype=np.float64).ravel()
+    heights = np.asarray(heights, dtype=np.float64).ravel()
+    if radii.shape != heights.shape:
+        raise ValueError("radii and heights must have the same length")
+    meshes: list = [None] * len(radii)
+    for radius in np.unique(radii):
+        idx = np.flatnonzero(radii == radius)
+        base = _capsule_base(float(radius), int(count))
+        z = base.vertices[:, 2]
+        # (variants, vertices, 3): every stretched copy of the base at once
+        stacked = np.repeat(base.vertices[None, :, :], len(idx), axis=0)
+        stacked[:, :, 2] += np.copysign(heights[idx, None] / 2.0, z[None, :])
+        for i, vertices in zip(idx, stacked):
+            meshes[i] = trimesh.Trimesh(vertices=vertices, faces=base.faces.copy(), process=False)
+    return meshes
 
 
 def create_torus(radius=1.0, tube_radius=0.25, sections: int = 64, tube_sections: int = 32) -> trimesh.Trimesh:
-    return trimesh.creation.torus(radius=radius, tube_radius=tube_radius, sections=sections, tube_sections=tube_sections)
+    return _torus(float(radius), float(tube_radius), int(sections), int(tube_sections)).copy()
 
 
 def export_mesh_glb(mesh: trimesh.Trimesh, out_path: Path) -> Path:
     out_path = Path(out_path)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    # Export to GLB (binary glTF)
-    scene = trimesh.Scene(mesh)
-    data = scene.export(file_type='glb')
-    out_path.write_bytes(data)
+    # Export to GLB (binary glTF). export_glb still builds mesh.scene() internally;
+    # calling it directly only skips the export(file_type=...) format dispatch.
+    # GLB bin chunks are stored raw (no zlib), and generated parts carry no PNG
+    # textures, so there is no compression level to tune here.
+    data = export_glb(mesh)
+    # Raw os.write of the bytes, published atomically (a watcher never sees half a GLB)
+    write_bytes_atomic(out_path, data)
     return out_path
@@ -1,21 +1,115 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import Optional
 
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTextEdit, QLabel
 
-import json
+from explorer import list_siblings
+
+try:
+    import orjson  # type: ignore
+    _json_loads = orjson.loads
+except Exception:
+    import json
+    _json_loads = json.loads
 try:
     import yaml  # type: ignore
+    _YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)  # libyaml when available
 except Exception:
     yaml = None
 
 
+def describe_path(p: Path) -> str:
+    """Build the inspector text for a path. Does file I/O; safe to call off the GUI thread."""
+    if p.is_dir():
+        try:
+            with os.scandir(p) as it:
+                count = sum(1 for _ in it)
+        except OSError:
+            count = 0
+        return f"Directory:\n{p}\n\nContains: {count} entries"
+    # file
+    try:
+        size = p.stat().st_size
+    except Exception:
+        size = 0
+    info = [
+        f"Path: {p}",
+        f"Size: {size} bytes",
+        f"Extension: {p.suffix.lower()}",
+    ]
+    # Find manifest sidecars
+    targets = []
+    if p.name.endswith('.ams.json') or p.name.endswith('.ams.yaml'):
+        targets.append(p)
+    else:
+        siblings = list_siblings(str(p.parent))
+        if f"{p.name}.ams.json" in siblings:
+            targets.append(Path(str(p) + ".ams.json"))
+        if f"{p.name}.ams.yaml" in siblings:
+            targets.append(Path(str(p) + ".ams.yaml"))
+    if targets:
+        target = next((t for t in targets if t.suffix.lower() == '.json'), targets[0])
+        try:
+            if target.suffix.lower() == '.json':
+                obj = _json_loads(target.read_bytes())
+                # Summarize key fields if present
+                ams_id = obj.get('ams_id')
+                created_on = obj.get('created_on')
+                tool_version = obj.get('tool_version')
+                scale = obj.get('scale') or {}
+                geometry = obj.get('geometry') or {}
+                summary = [
+                    "AMS Manifest:",
+                    f"  ams_id: {ams_id}",
+                    f"  created_on: {created_on}",
+                    f"  tool_version: {tool_version}",
+                    f"  scale: {scale}",
+                    f"  geometry: {geometry}",
+                ]
+                info.append("\n".join(summary))
+            else:
+                if yaml:
+                    obj = yaml.load(target.read_text(encoding='utf-8'), Loader=_YamlLoader)  # type: ignore
+                    info.append("AMS Manifest (YAML) present")
+                else:
+                    info.append("AMS Manifest (YAML) present — PyYAML not available")
+        except Exception as e:
+            info.append(f"Manifest read error: {e}")
+    return "\n".join(info)
+
+
+class _InspectSignals(QObject):
+    done = pyqtSignal(int, str)  # generation, text
+
+
+class _InspectJob(QRunnable):
+    def __init__(self, path: Path, generation: int, signals: _InspectSignals) -> None:
+        super().__init__()
+        self._path = path
+        self._generation = generation
+        self._signals = signals
+
+    def run(self) -> None:
+        try:
+            text = describe_path(self._path)
+        except Exception as e:  # pragma: no cover - defensive
+            text = f"Inspector error: {e}"
+        try:
+            self._signals.done.emit(self._generation, text)
+        except RuntimeError:
+            # Widget was destroyed while the job was running
+            pass
+
+
 class InspectorWidget(QWidget):
     """
     Read-only inspector for selected files.
     Shows basic file info and, when present, AMS Enhanced Metadata from sidecars.
+    File system access runs on the global QThreadPool; only the newest request is shown.
     """
 
     def __init__(self, parent: Optional[QWidget] = None) -> None:
@@ -28,65 +122,22 @@ class InspectorWidget(QWidget):
         lay.addWidget(self._text)
         lay.setContentsMargins(4, 4, 4, 4)
         self.setLayout(lay)
+        self._generation = 0
+        self._signals = _InspectSignals(self)
+        self._signals.done.connect(self._on_inspect_done)
 
     def update_path(self, path: Optional[Path]) -> None:
+        # Bumping the generation makes results of any in-flight job stale
+        self._generation += 1
         if path is None:
             self._label.setText("Inspector")
             self._text.clear()
             return
         p = Path(path)
         self._label.setText(f"Inspector: {p.name}")
-        if p.is_dir():
-            self._text.setPlainText(f"Directory:\n{p}\n\nContains: {len(list(p.glob('*')))} entries")
+        QThreadPool.globalInstance().start(_InspectJob(p, self._generation, self._signals))
+
+    def _on_inspect_done(self, generation: int, text: str) -> None:
+        if generation != self._generation:
             return
-        # file
-        try:
-            size = p.stat().st_size
-        except Exception:
-            size = 0
-        info = [
-            f"Path: {p}",
-            f"Size: {size} bytes",
-            f"Extension: {p.suffix.lower()}",
-        ]
-        # Find manifest sidecars
-        targets = []
-        if p.name.endswith('.ams.json') or p.name.endswith('.ams.yaml'):
-            targets.append(p)
-        else:
-            j = Path(str(p) + ".ams.json")
-            y = Path(str(p) + ".ams.yaml")
-            if j.exists():
-                targets.append(j)
-            if y.exists():
-                targets.append(y)
-        if targets:
-            target = next((t for t in targets if t.suffix.lower() == '.json'), targets[0])
-            try:
-                text = target.read_text(encoding='utf-8')
-                if target.suffix.lower() == '.json':
-                    obj = json.loads(text)
-                    # Summarize key fields if present
-                    ams_id = obj.get('ams_id')
-                    created_on = obj.get('created_on')
-                    tool_version = obj.get('tool_version')
-                    scale = obj.get('scale') or {}
-                    geometry = obj.get('geometry') or {}
-                    summary = [
-                        "AMS Manifest:",
-                        f"  ams_id: {ams_id}",
-                        f"  created_on: {created_on}",
-                        f"  tool_version: {tool_version}",
-                        f"  scale: {scale}",
-                        f"  geometry: {geometry}",
-                    ]
-                    info.append("\n".join(summary))
-                else:
-                    if yaml:
-                        obj = yaml.safe_load(text)  # type: ignore
-                        info.append("AMS Manifest (YAML) present")
-                    else:
-                        info.append("AMS Manifest (YAML) present — PyYAML not available")
-            except Exception as e:
-                info.append(f"Manifest read error: {e}")
-        self._text.setPlainText("\n".join(info))
+        self._text.setPlainText(text)
@@ -1,34 +1,52 @@
 """
 Enhanced sidecar manifest (AMS Enhanced Metadata) for parts, scenes, and assets.
-Writes JSON and YAML sidecars next to outputs.
+Writes JSON sidecars (and optionally YAML) next to outputs.
 """
 from __future__ import annotations
 
 import json
 import os
 import uuid
-from dataclasses import asdict, dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-import yaml
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
 
-from metadata.utils import sha256_file, get_user_host
+try:
+    import msgspec  # type: ignore
+except ImportError:
+    msgspec = None
+
+from metadata.utils import sha256_and_size, sha256_file, get_user_host, write_bytes_atomic as _write_atomic
 
 
 AMS_VERSION = "0.1"
 
 
-@dataclass
+@dataclass(slots=True)
 class GeometryInfo:
     bbox_min: Tuple[float, float, float]
     bbox_max: Tuple[float, float, float]
     extents: Tuple[float, float, float]
     units: str = "m"
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "bbox_min": self.bbox_min,
+            "bbox_max": self.bbox_max,
+            "extents": self.extents,
+            "units": self.units,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class SourceInfo:
     type: str  # e.g., "generated", "converted", "imported"
     input_path: Optional[str] = None
@@ -37,27 +55,50 @@ class SourceInfo:
     recipe_step: Optional[int] = None
     run_id: Optional[str] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "type": self.type,
+            "input_path": self.input_path,
+            "input_sha256": self.input_sha256,
+            "recipe_file": self.recipe_file,
+            "recipe_step": self.recipe_step,
+            "run_id": self.run_id,
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class OutputInfo:
     file_path: str
     file_size: int
     file_sha256: str
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "file_path": self.file_path,
+            "file_size": self.file_size,
+            "file_sha256": self.file_sha256,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class ScaleInfo:
     profile_id: str
     unit: str
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {"profile_id": self.profile_id, "unit": self.unit}
 
-@dataclass
+
+@dataclass(slots=True)
 class ConversionInfo:
     action: str
     parameters: Dict[str, Any] = field(default_factory=dict)
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {"action": self.action, "parameters": self.parameters}
+
 
-@dataclass
+@dataclass(slots=True)
 class AMSManifest:
     ams_version: str
     ams_id: str
@@ -77,27 +118,73 @@ class AMSManifest:
     conversion: Optional[ConversionInfo] = None
     audit: Optional[Dict[str, Any]] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict form for serialization.
+
+        Replaces dataclasses.asdict(), which deep-copies every field; lists and
+        dicts are shared with the manifest rather than copied.
+        """
+        return {
+            "ams_version": self.ams_version,
+            "ams_id": self.ams_id,
+            "created_on": self.created_on,
+            "created_by": self.created_by,
+            "host": self.host,
+            "tool_version": self.tool_version,
+            "seed_uuid": self.seed_uuid,
+            "iteration": self.iteration,
+            "lineage": self.lineage,
+            "tags": self.tags,
+            "classification": self.classification,
+            "scale": self.scale.to_dict(),
+            "source": self.source.to_dict(),
+            "output": self.output.to_dict(),
+            "geometry": self.geometry.to_dict() if self.geometry is not None else None,
+            "conversion": self.conversion.to_dict() if self.conversion is not None else None,
+            "audit": self.audit,
+        }
+
 
 def _now_iso() -> str:
+    # Measured faster than a time.time_ns()/strftime hand formatter (C isoformat)
     return datetime.now(timezone.utc).isoformat()
 
 
+@lru_cache(maxsize=1)
 def _tool_version() -> str:
     # Single source of truth can be wired later
     return "AI_Modding_Suite/0.1"
 
 
+# Time-ordered uuid7 where the stdlib provides it, uuid4 otherwise; resolved once at import
+_UUID_GEN = getattr(uuid, 'uuid7', uuid.uuid4)
+
+
 def _uuid7_str() -> str:
-    # Python 3.12 includes uuid.uuid7
-    try:
-        return str(uuid.uuid7())  # type: ignore[attr-defined]
-    except Exception:
-        return str(uuid.uuid4())
+    return str(_UUID_GEN())
+
+
+def _as_path(p: Any) -> Path:
+    # Coerce once at the public entry points; Path(Path) would re-parse the string
+    return p if isinstance(p, Path) else Path(p)
 
 
 def _sidecar_paths(output_path: Path) -> Tuple[Path, Path]:
-    base = Path(str(output_path) + ".ams")
-    return base.with_suffix(base.suffix + ".json"), base.with_suffix(base.suffix + ".yaml")
+    s = os.fspath(output_path)
+    return Path(s + ".ams.json"), Path(s + ".ams.yaml")
+
+
+# Shared pool so the source-file hash can overlap the output-file hash
+# (hashlib releases the GIL while digesting).
+_HASH_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ams-hash")
+
+
+def _hash_output_and_source(out: Path, source_input_path: Optional[Path]) -> Tuple[str, int, Optional[str]]:
+    """Return (output sha256, output size, source sha256 or None), hashing both files concurrently."""
+    f_in = _HASH_POOL.submit(sha256_file, source_input_path) if source_input_path else None
+    file_sha, file_size = sha256_and_size(out)
+    input_sha = f_in.result() if f_in is not None else None
+    return file_sha, file_size, input_sha
 
 
 def create_for_mesh(
@@ -117,9 +204,15 @@ def create_for_mesh(
     audit: Optional[Dict[str, Any]] = None,
 ) -> AMSManifest:
     user, host = get_user_host()
-    out = Path(output_path)
-    file_sha = sha256_file(out)
-    file_size = out.stat().st_size
+    out = _as_path(output_path)
+    file_sha, file_size, input_sha = _hash_output_and_source(out, source_input_path)
+    # NumPy bounds rows convert to Python floats in one tolist() call
+    if hasattr(bbox_min, 'tolist'):
+        bbox_min = bbox_min.tolist()
+    if hasattr(bbox_max, 'tolist'):
+        bbox_max = bbox_max.tolist()
+    bx0, by0, bz0 = float(bbox_min[0]), float(bbox_min[1]), float(bbox_min[2])
+    bx1, by1, bz1 = float(bbox_max[0]), float(bbox_max[1]), float(bbox_max[2])
     ams_id = _uuid7_str()
     manifest = AMSManifest(
         ams_version=AMS_VERSION,
@@ -137,7 +230,7 @@ def create_for_mesh(
         source=SourceInfo(
             type=source_type,
             input_path=str(source_input_path) if source_input_path else None,
-            input_sha256=sha256_file(source_input_path) if source_input_path else None,
+            input_sha256=input_sha,
             recipe_file=(recipe_ctx or {}).get("file"),
             recipe_step=(recipe_ctx or {}).get("step"),
             run_id=(recipe_ctx or {}).get("run_id"),
@@ -148,13 +241,9 @@ def create_for_mesh(
             file_sha256=file_sha,
         ),
         geometry=GeometryInfo(
-            bbox_min=tuple(map(float, bbox_min)),
-            bbox_max=tuple(map(float, bbox_max)),
-            extents=tuple(map(float, (
-                bbox_max[0] - bbox_min[0],
-                bbox_max[1] - bbox_min[1],
-                bbox_max[2] - bbox_min[2],
-            ))),
+            bbox_min=(bx0, by0, bz0),
+            bbox_max=(bx1, by1, bz1),
+            extents=(bx1 - bx0, by1 - by0, bz1 - bz0),
             units="m",
         ),
         conversion=ConversionInfo(action=conversion_action, parameters=conversion_params),
@@ -178,9 +267,8 @@ def create_for_file(
     audit: Optional[Dict[str, Any]] = None,
 ) -> AMSManifest:
     user, host = get_user_host()
-    out = Path(output_path)
-    file_sha = sha256_file(out)
-    file_size = out.stat().st_size
+    out = _as_path(output_path)
+    file_sha, file_size, input_sha = _hash_output_and_source(out, source_input_path)
     ams_id = _uuid7_str()
     manifest = AMSManifest(
         ams_version=AMS_VERSION,
@@ -198,7 +286,7 @@ def create_for_file(
         source=SourceInfo(
             type=source_type,
             input_path=str(source_input_path) if source_input_path else None,
-            input_sha256=sha256_file(source_input_path) if source_input_path else None,
+            input_sha256=input_sha,
             recipe_file=(recipe_ctx or {}).get("file"),
             recipe_step=(recipe_ctx or {}).get("step"),
             run_id=(recipe_ctx or {}).get("run_id"),
@@ -215,10 +303,85 @@ def create_for_file(
     return manifest
 
 
-def write_sidecars(manifest: AMSManifest, output_path: Path, write_yaml: bool = True) -> None:
-    json_path, yaml_path = _sidecar_paths(Path(output_path))
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(asdict(manifest), f, ensure_ascii=False, indent=2)
-    if write_yaml:
-        with open(yaml_path, 'w', encoding='utf-8') as f:
-            yaml.safe_dump(json.loads(json.dumps(asdict(manifest))), f, sort_keys=False)
+def _json_bytes(data: Any) -> bytes:
+    # orjson when installed (much faster); stdlib json otherwise, same output shape
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def _manifest_json_bytes(manifest: AMSManifest) -> bytes:
+    # msgspec encodes (slotted) dataclasses natively, skipping to_dict(); orjson
+    # on the dict is still faster when both are installed, so prefer it.
+    if orjson is None and msgspec is not None:
+        return msgspec.json.format(msgspec.json.encode(manifest), indent=2)
+    return _json_bytes(manifest.to_dict())
+
+
+# JSON is a subset of YAML, so the YAML sidecar is the JSON payload behind a
+# comment line; yaml.safe_load reads it back to the same dict.
+_YAML_HEADER = b"# YAML (JSON-compatible)\n"
+
+
+def write_sidecars(
+    manifest: AMSManifest,
+    output_path: Path,
+    write_yaml: bool = False,
+    fmt: str = "json",
+) -> None:
+    """Write the manifest sidecar(s) next to output_path.
+
+    fmt picks the primary sidecar: "json" (.ams.json, default), "yaml"
+    (.ams.yaml) or "msgpack" (.ams.msgpack, compact binary; needs msgspec).
+    write_yaml additionally emits the YAML sidecar, which reuses the JSON
+    bytes (see _YAML_HEADER) instead of running a YAML emitter.
+
+    Thread-safe: only touches its arguments and the sidecar files of
+    output_path, so distinct outputs can be written concurrently.
+    """
+    output_path = _as_path(output_path)
+    json_path, yaml_path = _sidecar_paths(output_path)
+    payload = _manifest_json_bytes(manifest) if fmt != "msgpack" or write_yaml else None
+    if fmt == "json":
+        _write_atomic(json_path, payload)
+    elif fmt == "msgpack":
+        if msgspec is None:
+            raise RuntimeError("msgspec is required for msgpack sidecars (pip install msgspec)")
+        # msgspec walks the dataclasses directly; no intermediate dict
+        _write_atomic(Path(os.fspath(output_path) + ".ams.msgpack"), msgspec.msgpack.encode(manifest))
+    elif fmt != "yaml":
+        raise ValueError(f"Unknown sidecar format: {fmt}")
+    if write_yaml or fmt == "yaml":
+        _write_atomic(yaml_path, _YAML_HEADER + payload)
+
+
+def write_sidecars_many(
+    manifests: Sequence[AMSManifest],
+    output_paths: Sequence[Path],
+    write_yaml: bool = False,
+    fmt: str = "json",
+) -> None:
+    """Write sidecars for many outputs at once, overlapping the file I/O.
+
+    Prefer this over a write_sidecars() loop for batch runs. Output paths must
+    be distinct. Re-raises the first failure after all writes finish.
+    """
+    if len(manifests) != len(output_paths):
+        raise ValueError("manifests and output_paths must have the same length")
+    if not manifests:
+        return
+    with ThreadPoolExecutor(max_workers=min(32, len(manifests)), thread_name_prefix="ams-sidecar") as pool:
+        futures = [
+            pool.submit(write_sidecars, m, p, write_yaml, fmt)
+            for m, p in zip(manifests, output_paths)
+        ]
+    for f in futures:
+        f.result()
+
+
+def materialize_yaml_sidecar(json_path: Path) -> Path:
+    """Create the .ams.yaml sidecar from an existing .ams.json one. Returns the YAML path."""
+    json_path = _as_path(json_path)
+    yaml_path = json_path.with_suffix('.yaml')
+    _write_atomic(yaml_path, _YAML_HEADER + json_path.read_bytes())
+    return yaml_path
@@ -5,21 +5,81 @@ from __future__ import annotations
 
 import getpass
 import hashlib
+import mmap
 import os
 import platform
+import sys
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple
 
 
-def sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
-    with open(path, 'rb') as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+_HASH_CHUNK = 128 * 1024
+# Map whole files on 64-bit; keep mappings small where address space is tight
+_MMAP_MAX = 1 << 40 if sys.maxsize > 2 ** 32 else 256 * 1024 * 1024
+
+
+def sha256_and_size(path: Path) -> Tuple[str, int]:
+    """Return (sha256 hex, size in bytes) using one open and an fstat on the same fd."""
+    with open(path, 'rb', buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        if 0 < size <= _MMAP_MAX:
+            # One update() over the mapping: no Python-level read loop, and
+            # just-written outputs are hashed straight from the page cache.
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return hashlib.sha256(mm).hexdigest(), size
+            except (OSError, ValueError):
+                pass
+        if hasattr(hashlib, 'file_digest'):
+            # Python 3.11+: the read/update loop runs entirely in C
+            return hashlib.file_digest(f, 'sha256').hexdigest(), size
+        h = hashlib.sha256()
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b''):
             h.update(chunk)
-    return h.hexdigest()
+        return h.hexdigest(), size
+
+
+def sha256_file(path: Path) -> str:
+    return sha256_and_size(path)[0]
+
+
+# Process umask, read once: mkstemp creates 0600 files, published files get the usual mode
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write data to a unique sibling temp file with raw os.write() calls on a
+    memoryview (no buffered-file copy), fsync it, and publish it via os.replace.
+
+    Readers never see a truncated file, concurrent writers of the same path never
+    share a temp file, and a crash can't publish an empty one.
+    """
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name + '.', suffix='.tmp')
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.chmod(tmp, 0o666 & ~_UMASK)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
 
 
+@lru_cache(maxsize=1)
 def get_user_host() -> Tuple[str, str]:
+    # Constant for the process lifetime; platform.node() can hit the OS each call
     try:
         user = getpass.getuser()
     except Exception:
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
+import hashlib
 import os
+import subprocess
+import sys
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional
 
-from PyQt6.QtCore import QSettings, Qt, QThread
+from PyQt6.QtCore import QSettings, Qt, QThread, QTimer, QRunnable, QThreadPool
 from PyQt6.QtWidgets import (
     QApplication,
     QMainWindow,
     QPushButton,
     QFileDialog,
-    QTextEdit,
+    QPlainTextEdit,
     QLabel,
     QVBoxLayout,
     QWidget,
@@ -21,23 +25,93 @@ from PyQt6.QtWidgets import (
     QDockWidget,
     QMenu,
     QDialog,
+    QProgressDialog,
 )
 
 from validators import ValidationResult
-from workers import run_validation_in_thread, run_recipe_in_thread
-from paths_utils import default_workspace_root, CFG_FILTER, ORG_NAME, APP_NAME
-from plugins.preset_ksp import create_tank_glb, create_tank_variants_glb
+from workers import (
+    run_validation_in_pool,
+    run_recipe_in_pool,
+    run_file_read_in_thread,
+    run_file_write_in_thread,
+    run_tank_family_in_pool,
+    run_scan_in_thread,
+)
+from paths_utils import (
+    default_workspace_root,
+    CFG_FILTER,
+    ORG_NAME,
+    APP_NAME,
+    FAST_DLG_OPTS,
+    FAST_DIR_DLG_OPTS,
+)
 from scale import get_current_profile, list_profiles, set_current_profile
-from explorer import ExplorerWidget
-from converters.converters import convert_model_to_glb, convert_image
+from explorer import ExplorerWidget, list_siblings
 from PyQt6.QtCore import QUrl
-from PyQt6.QtGui import QDesktopServices
+from PyQt6.QtGui import QDesktopServices, QFont, QTextCursor
 import json
 from inspector import InspectorWidget
-from ams_io.intake import stage_source, compute_intake_summary
-from scanning.scanner import scan_path, write_sidecar_from_scan
-from schemas.loader import validate_document
-import yaml
+
+try:
+    import orjson  # type: ignore
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+
+def _pretty_json(obj) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def _as_path(path) -> Path:
+    # Explorer actions may hand us str or Path; wrap once per action
+    return path if isinstance(path, Path) else Path(path)
+
+
+def _parse_doc(path: Path, text: str):
+    """Parse a JSON or YAML document, picking the parser by extension."""
+    if path.suffix.lower() == '.json':
+        return _json_loads(text)
+    import yaml
+    return yaml.load(text, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))  # libyaml when available
+
+
+# Heavy modules (trimesh, PIL, jsonschema, ...) behind the actions; imported at
+# call time so the window shows sooner, and prewarmed in the background.
+_DEFERRED_MODULES = (
+    "yaml",
+    "plugins.preset_ksp",
+    "converters.converters",
+    "ams_io.intake",
+    "scanning.scanner",
+    "scanning.cache",
+    "schemas.loader",
+    "recipes.runner",
+)
+
+
+class _PrewarmImports(QRunnable):
+    def run(self) -> None:
+        import importlib
+        for name in _DEFERRED_MODULES:
+            try:
+                importlib.import_module(name)
+            except Exception:
+                pass  # the action's own import will report it
+
+
+# Files above this size are fed to the editor in slices (see _load_text_chunked)
+_CHUNKED_LOAD_THRESHOLD = 512 * 1024
+_LOAD_CHUNK = 256 * 1024
+# Read-only report dialogs: line cap and feed slice size
+_VIEW_MAX_LINES = 50000
+_VIEW_CHUNK = 64 * 1024
+# Validation results are pure functions of the text; keep the most recent ones
+_VALIDATION_CACHE_SIZE = 64
+_VALIDATION_MAX_LINE = 200
 
 
 class ModdingSuite(QMainWindow):
@@ -47,11 +121,24 @@ class ModdingSuite(QMainWindow):
         self.resize(900, 650)
 
         self.settings = QSettings(ORG_NAME, APP_NAME)
+        # last_dir is read once and written back lazily; QSettings hits the
+        # registry/INI file on every access.
+        self._last_dir_cache = Path(self.settings.value("last_dir", type=str) or default_workspace_root())
+        self._last_dir_timer = QTimer(self)
+        self._last_dir_timer.setSingleShot(True)
+        self._last_dir_timer.setInterval(500)
+        self._last_dir_timer.timeout.connect(self._flush_last_dir)
         self.current_file: Optional[Path] = None
         self._modified: bool = False
-        self._validation_thread: Optional[QThread] = None
+        self._recipe_worker = None
+        self._validation_worker = None  # in-flight pooled validation (signal bridge)
+        self._io_jobs: list = []  # (thread, worker) pairs for in-flight file I/O
+        self._pending_reads = 0  # editor stays read-only while a load is in flight
+        self._validation_cache: OrderedDict[bytes, ValidationResult] = OrderedDict()
 
         self._init_ui()
+        # Once the event loop is running (window painted), warm the deferred imports
+        QTimer.singleShot(0, lambda: QThreadPool.globalInstance().start(_PrewarmImports()))
 
     # UI setup
     def _init_ui(self) -> None:
@@ -60,7 +147,12 @@ class ModdingSuite(QMainWindow):
         self.label = QLabel("Select a mod file or create a new one:")
         layout.addWidget(self.label)
 
-        self.text_edit = QTextEdit()
+        # Line-based plain-text layout; QTextEdit's rich-text layout is much slower on big configs
+        self.text_edit = QPlainTextEdit()
+        self.text_edit.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        font = QFont("Consolas", 10)
+        font.setStyleHint(QFont.StyleHint.Monospace)  # fallback off Windows
+        self.text_edit.document().setDefaultFont(font)
         self.text_edit.textChanged.connect(self._on_text_changed)
         layout.addWidget(self.text_edit)
 
@@ -145,22 +237,93 @@ class ModdingSuite(QMainWindow):
         act_root.triggered.connect(self.set_explorer_root)
 
     def _last_dir(self) -> Path:
-        p = self.settings.value("last_dir", type=str)
-        if p:
-            return Path(p)
-        return default_workspace_root()
+        return self._last_dir_cache
 
     def _set_last_dir(self, p: Path) -> None:
-        self.settings.setValue("last_dir", str(p))
+        self._last_dir_cache = Path(p)
+        self._last_dir_timer.start()  # restart: rapid updates coalesce into one write
+
+    def _flush_last_dir(self) -> None:
+        self._last_dir_timer.stop()
+        self.settings.setValue("last_dir", str(self._last_dir_cache))
 
     def _on_text_changed(self) -> None:
+        # Only the first edit matters; stop listening until the buffer is clean again
         self._modified = True
+        self.text_edit.textChanged.disconnect(self._on_text_changed)
+
+    def _mark_clean(self) -> None:
+        if self._modified:
+            self._modified = False
+            self.text_edit.textChanged.connect(self._on_text_changed)
+
+    def _load_text_chunked(self, text: str) -> None:
+        """Replace the editor contents, inserting large texts in slices with repaints off.
+
+        Either way textChanged fires (once), so the buffer ends up modified; callers
+        that loaded it from disk call _mark_clean() themselves.
+        """
+        te = self.text_edit
+        if len(text) <= _CHUNKED_LOAD_THRESHOLD:
+            te.setPlainText(text)
+            return
+        doc = te.document()
+        te.setUpdatesEnabled(False)
+        te.blockSignals(True)  # skip a textChanged per slice
+        doc.setUndoRedoEnabled(False)  # like setPlainText: loading is not an undo step
+        try:
+            te.clear()
+            cursor = QTextCursor(doc)
+            cursor.beginEditBlock()
+            for i in range(0, len(text), _LOAD_CHUNK):
+                cursor.insertText(text[i:i + _LOAD_CHUNK])
+            cursor.endEditBlock()
+        finally:
+            doc.setUndoRedoEnabled(True)
+            te.blockSignals(False)
+            te.setUpdatesEnabled(True)
+        te.textChanged.emit()  # one notification for the whole load, as setPlainText gives
+
+    def _start_io_job(self, thread: QThread, worker, on_finished, on_error) -> None:
+        # Keep references until the thread stops so neither side is GC'd mid-run
+        job = (thread, worker)
+        self._io_jobs.append(job)
+        worker.finished.connect(on_finished)
+        worker.error.connect(on_error)
+        worker.finished.connect(thread.quit)
+        worker.error.connect(thread.quit)
+        thread.finished.connect(lambda: self._io_jobs.remove(job))
+        thread.start()
+
+    def _read_file_async(self, path: Path, on_text, error_title: str) -> None:
+        """Read path on a worker thread and hand the text to on_text on the GUI thread."""
+        self._set_status(f"Reading: {path}")
+        thread, worker = run_file_read_in_thread(path)
+        # Typing now would be overwritten when the text arrives, so lock the editor
+        self._pending_reads += 1
+        self.text_edit.setReadOnly(True)
+
+        def read_done() -> None:
+            self._pending_reads -= 1
+            if not self._pending_reads:
+                self.text_edit.setReadOnly(False)
+
+        def on_finished(text: str) -> None:
+            read_done()
+            on_text(text)
+
+        def on_error(msg: str) -> None:
+            read_done()
+            QMessageBox.critical(self, "Error", f"{error_title}: {msg}")
+            self._set_status("Read failed")
+
+        self._start_io_job(thread, worker, on_finished, on_error)
 
     # Slots
     def load_mod_file(self) -> None:
         start_dir = str(self._last_dir())
         file_name, _ = QFileDialog.getOpenFileName(
-            self, "Open Mod File", start_dir, CFG_FILTER
+            self, "Open Mod File", start_dir, CFG_FILTER, options=FAST_DLG_OPTS
         )
         if not file_name:
             return
@@ -168,25 +331,27 @@ class ModdingSuite(QMainWindow):
         if not fpath.exists():
             QMessageBox.warning(self, "Error", "File not found!")
             return
-        try:
-            text = fpath.read_text(encoding="utf-8")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load file: {e}")
-            return
-        self.text_edit.setPlainText(text)
-        self.current_file = fpath
-        self._modified = False
-        self._set_last_dir(fpath.parent)
-        self._set_status(f"Loaded: {fpath}")
+
+        def on_text(text: str) -> None:
+            self._load_text_chunked(text)
+            self.current_file = fpath
+            self._mark_clean()
+            self._set_last_dir(fpath.parent)
+            self._set_status(f"Loaded: {fpath}")
+
+        self._read_file_async(fpath, on_text, "Failed to load file")
 
     def save_mod_file(self) -> None:
         text = self.text_edit.toPlainText()
+        # The editor stays editable during the background write; only a buffer
+        # still at this revision matches what lands on disk
+        revision = self.text_edit.document().revision()
         # If already have a current file, ask whether to overwrite or Save As
         target_path: Optional[Path] = self.current_file
         if target_path is None:
             start_dir = str(self._last_dir())
             file_name, _ = QFileDialog.getSaveFileName(
-                self, "Save Mod File", start_dir, CFG_FILTER
+                self, "Save Mod File", start_dir, CFG_FILTER, options=FAST_DLG_OPTS
             )
             if not file_name:
                 return
@@ -204,21 +369,27 @@ class ModdingSuite(QMainWindow):
                     # Save As
                     start_dir = str(self._last_dir())
                     file_name, _ = QFileDialog.getSaveFileName(
-                        self, "Save Mod File As", start_dir, CFG_FILTER
+                        self, "Save Mod File As", start_dir, CFG_FILTER, options=FAST_DLG_OPTS
                     )
                     if not file_name:
                         return
                     target_path = Path(file_name)
-        try:
-            target_path.write_text(text, encoding="utf-8")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to save file: {e}")
-            return
-        self.current_file = target_path
-        self._modified = False
-        self._set_last_dir(target_path.parent)
-        QMessageBox.information(self, "Success", f"Saved: {target_path}")
-        self._set_status(f"Saved: {target_path}")
+        self._set_status(f"Saving: {target_path}")
+        thread, worker = run_file_write_in_thread(target_path, text)
+
+        def on_saved(_path: str) -> None:
+            self.current_file = target_path
+            if self.text_edit.document().revision() == revision:
+                self._mark_clean()  # otherwise edits made during the write stay unsaved
+            self._set_last_dir(target_path.parent)
+            QMessageBox.information(self, "Success", f"Saved: {target_path}")
+            self._set_status(f"Saved: {target_path}")
+
+        def on_error(msg: str) -> None:
+            QMessageBox.critical(self, "Error", f"Failed to save file: {msg}")
+            self._set_status("Save failed")
+
+        self._start_io_job(thread, worker, on_saved, on_error)
 
     def clear_editor(self) -> None:
         if self._modified and self.text_edit.toPlainText().strip():
@@ -233,7 +404,7 @@ class ModdingSuite(QMainWindow):
                 return
         self.text_edit.clear()
         self.current_file = None
-        self._modified = False
+        self._mark_clean()
         self._set_status("Editor cleared")
 
     def run_ai_validation(self) -> None:
@@ -243,8 +414,7 @@ class ModdingSuite(QMainWindow):
             return
 
         self._set_status("Validating...")
-        thread, worker = run_validation_in_thread(text=text, max_line_length=200)
-        self._validation_thread = thread  # keep reference to avoid GC
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
 
         def on_finished(result: ValidationResult) -> None:
             try:
@@ -252,9 +422,7 @@ class ModdingSuite(QMainWindow):
                     QMessageBox.information(self, "Validation", "No issues found.")
                 else:
                     # Show a concise summary; for large outputs, truncate
-                    summary = result.as_text()
-                    if len(summary) > 4000:
-                        summary = summary[:4000] + "\n... (truncated)"
+                    summary = result.as_text(max_chars=4000)
                     QMessageBox.information(self, "Validation Report", summary)
             finally:
                 self._set_status("Validation complete")
@@ -263,14 +431,28 @@ class ModdingSuite(QMainWindow):
             QMessageBox.critical(self, "Validation Error", msg)
             self._set_status("Validation error")
 
+        cached = self._validation_cache.get(key)
+        if cached is not None:
+            # Same text as a recent run: same result, no worker thread needed
+            self._validation_cache.move_to_end(key)
+            QTimer.singleShot(0, lambda: on_finished(cached))
+            return
+
+        def remember(result: ValidationResult) -> None:
+            self._validation_cache[key] = result
+            if len(self._validation_cache) > _VALIDATION_CACHE_SIZE:
+                self._validation_cache.popitem(last=False)
+
+        if self._validation_worker is not None:
+            self._validation_worker.cancel()  # superseded: stop the old run early
+        runnable, worker = run_validation_in_pool(text=text, max_line_length=_VALIDATION_MAX_LINE)
+        self._validation_worker = worker  # keep the signal bridge alive until it reports
+
         # Wire signals
+        worker.finished.connect(remember)
         worker.finished.connect(on_finished)
         worker.error.connect(on_error)
-        thread.finished.connect(lambda: setattr(self, "_validation_thread", None))
-
-        # Auto-cleanup
-        worker.finished.connect(thread.quit)
-        thread.start()
+        runnable.start()
 
     # Prompt on close if unsaved
     def closeEvent(self, event) -> None:  # type: ignore[override]
@@ -285,10 +467,28 @@ class ModdingSuite(QMainWindow):
             if resp != QMessageBox.StandardButton.Yes:
                 event.ignore()
                 return
+        if self._last_dir_timer.isActive():
+            self._flush_last_dir()
+        # Don't keep pool threads busy on work nobody will see
+        for worker in (self._validation_worker, self._recipe_worker):
+            if worker is not None:
+                worker.cancel()
+        # A QThread destroyed while running aborts the process (and would lose a
+        # save in flight), so let pending file I/O, scans and tank runs finish
+        threads = [thread for thread, _ in self._io_jobs]
+        tank_thread = getattr(self, "_tank_thread", None)
+        if tank_thread is not None:
+            threads.append(tank_thread)
+        if threads:
+            self._set_status("Finishing pending file operations…")
+        for thread in threads:
+            thread.quit()  # leaves the event loop once the worker's run() returns
+            thread.wait()
         event.accept()
 
     # Tools menu actions
     def generate_ksp_tank(self) -> None:
+        from plugins.preset_ksp import create_tank_glb
         # Ask for diameter and length factor, using the selected scale profile
         sp = get_current_profile(self.settings)
         unit_label = "mm" if sp.unit == "mm" else "m"
@@ -316,7 +516,7 @@ class ModdingSuite(QMainWindow):
         if not ok:
             return
         start_dir = str(self._last_dir())
-        out_path, _ = QFileDialog.getSaveFileName(self, "Save Tank GLB", start_dir, "glTF Binary (*.glb)")
+        out_path, _ = QFileDialog.getSaveFileName(self, "Save Tank GLB", start_dir, "glTF Binary (*.glb)", options=FAST_DLG_OPTS)
         if not out_path:
             return
         try:
@@ -324,6 +524,7 @@ class ModdingSuite(QMainWindow):
             p.parent.mkdir(parents=True, exist_ok=True)
             diameter_m = sp.to_meters(float(diameter))
             create_tank_glb(p, diameter_m=diameter_m, body_length_factor=length_factor, segments=128, scale_profile_id=sp.id)
+            list_siblings.cache_clear()  # new .ams.json next to the GLB
             self._set_last_dir(p.parent)
             QMessageBox.information(self, "Success", f"Created tank: {p}")
             self._set_status(f"Created tank: {p}")
@@ -342,28 +543,50 @@ class ModdingSuite(QMainWindow):
         if not ok:
             return
         def parse_floats(s: str):
-            vals = []
-            for tok in s.split(','):
-                tok = tok.strip()
-                if not tok:
-                    continue
-                vals.append(float(tok))
-            return vals
-        diameters = [sp.to_meters(v) for v in parse_floats(diam_text)]
-        length_factors = parse_floats(len_text)
+            # float() strips whitespace itself; map keeps the loop in C. ';' also separates.
+            return list(map(float, filter(str.strip, s.replace(';', ',').split(','))))
+        try:
+            diameters = [sp.to_meters(v) for v in parse_floats(diam_text)]
+            length_factors = parse_floats(len_text)
+        except ValueError as e:
+            QMessageBox.warning(self, "Invalid Input", f"Could not parse number list: {e}")
+            return
         if not diameters or not length_factors:
             QMessageBox.warning(self, "Input Required", "Please provide at least one diameter and one length factor.")
             return
-        out_dir = QFileDialog.getExistingDirectory(self, "Output Directory", str(self._last_dir()))
+        out_dir = QFileDialog.getExistingDirectory(self, "Output Directory", str(self._last_dir()), options=FAST_DIR_DLG_OPTS)
         if not out_dir:
             return
-        try:
-            created = create_tank_variants_glb(Path(out_dir), diameters, length_factors, segments=128, scale_profile_id=sp.id)
+        total = len(diameters) * len(length_factors)
+        progress = QProgressDialog("Generating tank variants…", None, 0, total, self)
+        progress.setWindowTitle("Tank Family")
+        progress.setMinimumDuration(0)
+        progress.setValue(0)
+        self._set_status("Generating tank family…")
+        thread, worker = run_tank_family_in_pool(Path(out_dir), diameters, length_factors, segments=128, scale_profile_id=sp.id)
+        self._tank_thread = thread  # keep reference to avoid GC
+        self._tank_worker = worker
+
+        def on_finished(created) -> None:
+            progress.close()
+            list_siblings.cache_clear()  # new GLBs and sidecars in out_dir
             self._set_last_dir(Path(out_dir))
             QMessageBox.information(self, "Success", f"Created {len(created)} tank variants in {out_dir}")
             self._set_status(f"Created {len(created)} tank variants")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to create tank family: {e}")
+
+        def on_error(msg: str) -> None:
+            progress.close()
+            list_siblings.cache_clear()  # variants written before the failure
+            QMessageBox.critical(self, "Error", f"Failed to create tank family: {msg}")
+            self._set_status("Tank family failed")
+
+        worker.progress.connect(lambda done, _total: progress.setValue(done))
+        worker.finished.connect(on_finished)
+        worker.error.connect(on_error)
+        worker.finished.connect(thread.quit)
+        worker.error.connect(thread.quit)
+        thread.finished.connect(lambda: setattr(self, "_tank_thread", None))
+        thread.start()
 
     def choose_scale_profile(self) -> None:
         # Simple chooser dialog using profile names
@@ -405,32 +628,34 @@ class ModdingSuite(QMainWindow):
 
     # Explorer support methods
     def set_explorer_root(self) -> None:
-        dir_ = QFileDialog.getExistingDirectory(self, "Explorer Root", str(self._last_dir()))
+        dir_ = QFileDialog.getExistingDirectory(self, "Explorer Root", str(self._last_dir()), options=FAST_DIR_DLG_OPTS)
         if not dir_:
             return
+        list_siblings.cache_clear()
         self._explorer.set_root(Path(dir_))
         self._set_last_dir(Path(dir_))
 
     def open_file_in_editor(self, path: Path) -> None:
-        try:
-            text = Path(path).read_text(encoding="utf-8")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to open file: {e}")
-            return
-        self.text_edit.setPlainText(text)
-        self.current_file = Path(path)
-        self._modified = False
-        self._set_status(f"Opened in editor: {path}")
+        p = _as_path(path)
+
+        def on_text(text: str) -> None:
+            self._load_text_chunked(text)
+            self.current_file = p
+            self._mark_clean()
+            self._set_status(f"Opened in editor: {p}")
+
+        self._read_file_async(p, on_text, "Failed to open file")
 
     def validate_file_action(self, path: Path) -> None:
-        try:
-            text = Path(path).read_text(encoding="utf-8")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to read file: {e}")
-            return
-        self.text_edit.setPlainText(text)
-        self.current_file = Path(path)
-        self.run_ai_validation()
+        p = _as_path(path)
+
+        def on_text(text: str) -> None:
+            self._load_text_chunked(text)
+            self.current_file = p
+            self._mark_clean()  # buffer matches the file on disk
+            self.run_ai_validation()
+
+        self._read_file_async(p, on_text, "Failed to read file")
 
     def open_in_map_editor(self, path: Path) -> None:
         try:
@@ -442,7 +667,7 @@ class ModdingSuite(QMainWindow):
         # try to call open_asset if available
         if hasattr(editor, "open_asset"):
             try:
-                editor.open_asset(Path(path))  # type: ignore[attr-defined]
+                editor.open_asset(_as_path(path))  # type: ignore[attr-defined]
             except Exception:
                 pass
         editor.show()
@@ -451,43 +676,57 @@ class ModdingSuite(QMainWindow):
         self._child_windows.append(editor)
 
     def convert_model_to_glb_action(self, path: Path) -> None:
-        out, _ = QFileDialog.getSaveFileName(self, "Save GLB", str(Path(path).with_suffix('.glb')), "glTF Binary (*.glb)")
+        from converters.converters import convert_model_to_glb
+        p = _as_path(path)
+        out, _ = QFileDialog.getSaveFileName(self, "Save GLB", str(p.with_suffix('.glb')), "glTF Binary (*.glb)", options=FAST_DLG_OPTS)
         if not out:
             return
         try:
-            convert_model_to_glb(Path(path), Path(out))
+            convert_model_to_glb(p, Path(out))
+            list_siblings.cache_clear()  # new .ams.json next to the GLB
             QMessageBox.information(self, "Converted", f"Saved GLB: {out}")
             self._set_status(f"Converted to GLB: {out}")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Conversion failed: {e}")
 
     def convert_image_action(self, path: Path) -> None:
+        from converters.converters import convert_image
         fmt, ok = QInputDialog.getItem(self, "Image Format", "Choose format:", ["PNG", "JPEG"], current=0, editable=False)
         if not ok:
             return
         suffix = ".png" if fmt.upper() == "PNG" else ".jpg"
-        out, _ = QFileDialog.getSaveFileName(self, "Save Image", str(Path(path).with_suffix(suffix)), f"{fmt} (*.{suffix[1:]})")
+        p = _as_path(path)
+        out, _ = QFileDialog.getSaveFileName(self, "Save Image", str(p.with_suffix(suffix)), f"{fmt} (*.{suffix[1:]})", options=FAST_DLG_OPTS)
         if not out:
             return
         try:
-            convert_image(Path(path), Path(out), format=fmt.upper())
+            convert_image(p, Path(out), format=fmt.upper())
+            list_siblings.cache_clear()  # new .ams.json next to the image
             QMessageBox.information(self, "Converted", f"Saved image: {out}")
             self._set_status(f"Converted image: {out}")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Image conversion failed: {e}")
 
     def reveal_in_explorer(self, path: Path) -> None:
-        # Use Windows Explorer to select the file
-        try:
-            import subprocess
-            subprocess.run(["explorer", "/select,", str(path)], check=False)
-        except Exception:
-            QDesktopServices.openUrl(QUrl.fromLocalFile(str(Path(path).parent)))
+        # Use Windows Explorer to select the file; fire and forget, never wait on it
+        if sys.platform == "win32":
+            try:
+                subprocess.Popen(
+                    ["explorer", "/select,", str(path)],
+                    close_fds=True,
+                    creationflags=getattr(subprocess, "DETACHED_PROCESS", 0),
+                )
+                return
+            except Exception:
+                pass
+        QDesktopServices.openUrl(QUrl.fromLocalFile(str(_as_path(path).parent)))
 
     def stage_in_intake_action(self, path: Path) -> None:
         # Choose source name and stage into the workspace Intake
         from PyQt6.QtWidgets import QInputDialog, QMessageBox
-        src = Path(path)
+        from ams_io.intake import stage_source, compute_intake_summary
+        from scanning.cache import get_or_compute
+        src = _as_path(path)
         default_name = src.stem if src.is_file() else src.name
         name, ok = QInputDialog.getText(self, "Source Name", "Name for intake staging:", text=default_name)
         if not ok or not name:
@@ -512,63 +751,99 @@ class ModdingSuite(QMainWindow):
                 QMessageBox.StandardButton.Yes,
             )
             if scan_now == QMessageBox.StandardButton.Yes:
-                data = scan_path(staged)
+                data = get_or_compute(staged)
                 self._show_scan_summary(data)
             # Open staged folder
+            list_siblings.cache_clear()
             self._explorer.set_root(staged)
             self._set_last_dir(staged)
             self._on_explorer_selection_changed()
         except Exception as e:
             QMessageBox.critical(self, "Intake Error", f"Failed to stage: {e}")
 
-    def _show_scan_summary(self, data) -> None:
-        from PyQt6.QtWidgets import QDialog
+    def _show_text_dialog(self, title: str, text: str) -> None:
+        """Show text in a read-only QPlainTextEdit dialog, fed in slices with one layout pass."""
+        lines = text.split("\n", _VIEW_MAX_LINES)
+        if len(lines) > _VIEW_MAX_LINES:
+            text = "\n".join(lines[:_VIEW_MAX_LINES]) + "\n... (truncated)"
         dlg = QDialog(self)
-        dlg.setWindowTitle("Scan / Analyze Summary")
-        te = QTextEdit(dlg)
+        dlg.setWindowTitle(title)
+        te = QPlainTextEdit(dlg)
         te.setReadOnly(True)
-        import json as _json
-        te.setPlainText(_json.dumps(data, indent=2, ensure_ascii=False))
+        te.setUpdatesEnabled(False)
+        cursor = QTextCursor(te.document())
+        cursor.beginEditBlock()
+        for i in range(0, len(text), _VIEW_CHUNK):
+            cursor.insertText(text[i:i + _VIEW_CHUNK])
+        cursor.endEditBlock()
+        te.setUpdatesEnabled(True)
+        te.moveCursor(QTextCursor.MoveOperation.Start)
         lay = QVBoxLayout()
         lay.addWidget(te)
         dlg.setLayout(lay)
         dlg.resize(800, 600)
         dlg.exec()
 
+    def _show_scan_summary(self, data) -> None:
+        self._show_text_dialog("Scan / Analyze Summary", json.dumps(data, indent=2, ensure_ascii=False))
+
     def scan_analyze_action(self, path: Path) -> None:
         from PyQt6.QtWidgets import QMessageBox
-        p = Path(path)
-        data = scan_path(p)
-        self._show_scan_summary(data)
-        if data.get("kind") == "file":
-            resp = QMessageBox.question(
-                self,
-                "Write Manifest",
-                "Write or update AMS sidecar for this file?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                QMessageBox.StandardButton.Yes,
-            )
-            if resp == QMessageBox.StandardButton.Yes:
-                out = write_sidecar_from_scan(p)
-                if out:
-                    QMessageBox.information(self, "Manifest", f"Sidecar written: {out}")
-                else:
-                    QMessageBox.warning(self, "Manifest", "Failed to write sidecar.")
+        from scanning.scanner import write_sidecar_from_scan
+        p = _as_path(path)
+        progress = QProgressDialog("Scanning…", None, 0, 0, self)  # busy until the file count is known
+        progress.setWindowTitle("Scan / Analyze")
+        progress.setMinimumDuration(300)
+        self._set_status(f"Scanning: {p}")
+        thread, worker = run_scan_in_thread(p)
+
+        def on_progress(done: int, total: int) -> None:
+            progress.setMaximum(total)
+            progress.setValue(done)
+
+        def on_finished(data) -> None:
+            progress.close()
+            self._set_status("Scan complete")
+            self._show_scan_summary(data)
+            if data.get("kind") == "file":
+                resp = QMessageBox.question(
+                    self,
+                    "Write Manifest",
+                    "Write or update AMS sidecar for this file?",
+                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                    QMessageBox.StandardButton.Yes,
+                )
+                if resp == QMessageBox.StandardButton.Yes:
+                    out = write_sidecar_from_scan(p, data)
+                    list_siblings.cache_clear()
+                    if out:
+                        QMessageBox.information(self, "Manifest", f"Sidecar written: {out}")
+                    else:
+                        QMessageBox.warning(self, "Manifest", "Failed to write sidecar.")
+
+        def on_error(msg: str) -> None:
+            progress.close()
+            QMessageBox.critical(self, "Scan Error", msg)
+            self._set_status("Scan failed")
+
+        worker.progress.connect(on_progress)
+        self._start_io_job(thread, worker, on_finished, on_error)
 
     def validate_schema_action(self, path: Path) -> None:
         # Choose schema and validate a JSON/YAML document (or its AMS sidecar)
         from PyQt6.QtWidgets import QFileDialog, QMessageBox
-        doc_path = Path(path)
+        from schemas.loader import validate_document, validate_document_stream
+        doc_path = _as_path(path)
         target_doc: Path | None = None
         if doc_path.suffix.lower() in {'.json', '.yaml', '.yml'}:
             target_doc = doc_path
         else:
-            j = Path(str(doc_path) + '.ams.json')
-            y = Path(str(doc_path) + '.ams.yaml')
-            if j.exists():
-                target_doc = j
-            elif y.exists():
-                target_doc = y
+            s = str(doc_path)
+            siblings = list_siblings(str(doc_path.parent))
+            if doc_path.name + '.ams.json' in siblings:
+                target_doc = Path(s + '.ams.json')
+            elif doc_path.name + '.ams.yaml' in siblings:
+                target_doc = Path(s + '.ams.yaml')
         if not target_doc:
             QMessageBox.information(self, "Validate Schema", "Select a JSON/YAML file or an asset with .ams sidecars.")
             return
@@ -576,17 +851,19 @@ class ModdingSuite(QMainWindow):
             self,
             "Select Schema JSON",
             str(Path('standards/schemas').resolve()),
-            "JSON Schema (*.json)"
+            "JSON Schema (*.json)",
+            options=FAST_DLG_OPTS,
         )
         if not schema_file:
             return
         try:
-            text = target_doc.read_text(encoding='utf-8')
             if target_doc.suffix.lower() == '.json':
-                doc = json.loads(text)
+                # Record-by-record for array documents; bounded memory on huge files
+                errors = validate_document_stream(target_doc, schema_file)
             else:
-                doc = yaml.safe_load(text)
-            errors = validate_document(doc, schema_file)
+                text = target_doc.read_text(encoding='utf-8')
+                doc = _parse_doc(target_doc, text)
+                errors = validate_document(doc, schema_file)
             if errors:
                 msg = "\n".join(errors)
                 if len(msg) > 6000:
@@ -599,16 +876,17 @@ class ModdingSuite(QMainWindow):
 
     # Manifest and recipe actions
     def view_manifest_action(self, path: Path) -> None:
-        p = Path(path)
+        p = _as_path(path)
         targets = []
         # If user right-clicked the product (e.g., .glb), look for sidecars
-        if not p.name.endswith('.ams.json') and not p.name.endswith('.ams.yaml'):
-            j = Path(str(p) + ".ams.json")
-            y = Path(str(p) + ".ams.yaml")
-            if j.exists():
-                targets.append(j)
-            if y.exists():
-                targets.append(y)
+        if not p.name.endswith(('.ams.json', '.ams.yaml')):
+            # One cached directory listing instead of a stat per candidate
+            s = str(p)
+            siblings = list_siblings(str(p.parent))
+            if p.name + ".ams.json" in siblings:
+                targets.append(Path(s + ".ams.json"))
+            if p.name + ".ams.yaml" in siblings:
+                targets.append(Path(s + ".ams.yaml"))
         else:
             targets.append(p)
         if not targets:
@@ -618,58 +896,65 @@ class ModdingSuite(QMainWindow):
         target = next((t for t in targets if t.suffix.lower() == '.json'), targets[0])
         try:
             text = target.read_text(encoding='utf-8')
-            # Pretty-print JSON where applicable
-            if target.suffix.lower() == '.json':
-                obj = json.loads(text)
-                text = json.dumps(obj, indent=2, ensure_ascii=False)
+            # Pretty-print JSON where applicable; sidecars are written indented already
+            if target.suffix.lower() == '.json' and not text.startswith(('{\n  ', '[\n  ')):
+                text = _pretty_json(_parse_doc(target, text))
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to read manifest: {e}")
             return
-        dlg = QDialog(self)
-        dlg.setWindowTitle(f"Manifest: {target.name}")
-        te = QTextEdit(dlg)
-        te.setReadOnly(True)
-        te.setPlainText(text)
-        lay = QVBoxLayout()
-        lay.addWidget(te)
-        dlg.setLayout(lay)
-        dlg.resize(800, 600)
-        dlg.exec()
+        self._show_text_dialog(f"Manifest: {target.name}", text)
 
     def run_recipe_action(self, path: Path) -> None:
-        p = Path(path)
+        p = _as_path(path)
         if not p.exists():
             QMessageBox.warning(self, "Recipe", "File does not exist.")
             return
         self._set_status("Running recipe…")
-        thread, worker = run_recipe_in_thread(str(p))
-        self._recipe_thread = thread
-
-        def on_finished(results):
+        runnable, worker = run_recipe_in_pool(str(p))
+        self._recipe_worker = worker  # keep the signal bridge alive until it reports
+        progress = QProgressDialog("Running recipe…", "Cancel", 0, 0, self)  # busy until the step count is known
+        progress.setWindowTitle("Recipe")
+        progress.setMinimumDuration(500)
+        progress.canceled.connect(worker.cancel)
+
+        def on_progress(done: int, total: int) -> None:
+            progress.setMaximum(total)
+            progress.setValue(done)
+
+        def on_finished(results, heading: str = "Completed."):
+            progress.close()
+            list_siblings.cache_clear()  # recipe steps write outputs and sidecars
             # Format a concise summary
+            ok_count = sum(1 for r in results if r.ok)
+            fail_count = len(results) - ok_count
             lines = []
-            ok_count = 0
-            fail_count = 0
+            total = -1
+            summary = None
             for r in results:
                 status = "OK" if r.ok else "FAIL"
-                if r.ok:
-                    ok_count += 1
-                else:
-                    fail_count += 1
                 out = f" -> {len(r.outputs)} outputs" if getattr(r, 'outputs', None) else ""
-                lines.append(f"[{status}] {r.index}: {r.action}{out} — {r.message}")
-            summary = "\n".join(lines)
-            if len(summary) > 6000:
-                summary = summary[:6000] + "\n... (truncated)"
-            QMessageBox.information(self, "Recipe Results", f"Completed. OK={ok_count}, FAIL={fail_count}\n\n{summary}")
-            self._set_status("Recipe complete")
+                line = f"[{status}] {r.index}: {r.action}{out} — {r.message}"
+                lines.append(line)
+                total += len(line) + 1
+                if total > 6000:
+                    # Stop formatting once past what the dialog shows
+                    summary = "\n".join(lines)[:6000] + "\n... (truncated)"
+                    break
+            if summary is None:
+                summary = "\n".join(lines)
+            QMessageBox.information(self, "Recipe Results", f"{heading} OK={ok_count}, FAIL={fail_count}\n\n{summary}")
+            self._set_status("Recipe complete" if heading == "Completed." else "Recipe cancelled")
+
+        def on_cancelled(results):
+            on_finished(results, heading=f"Cancelled after {len(results)} step(s).")
 
         def on_error(msg: str):
+            progress.close()
             QMessageBox.critical(self, "Recipe Error", msg)
             self._set_status("Recipe error")
 
+        worker.progress.connect(on_progress)
         worker.finished.connect(on_finished)
+        worker.cancelled.connect(on_cancelled)
         worker.error.connect(on_error)
-        worker.finished.connect(thread.quit)
-        thread.finished.connect(lambda: setattr(self, "_recipe_thread", None))
-        thread.start()
+        runnable.start()
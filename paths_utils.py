@@ -3,15 +3,19 @@ Path and dialog utilities using Qt's standard locations.
 """
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from PyQt6.QtCore import QStandardPaths
+from PyQt6.QtWidgets import QFileDialog
 
 
 APP_NAME = "AI_Modding_Suite"
 ORG_NAME = "BarefootMikeOfHorme"  # used for QSettings in the app
 
 
+@lru_cache(maxsize=1)
 def default_workspace_root() -> Path:
+    # Constant for the process lifetime; Path is immutable so sharing it is safe
     docs = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.DocumentsLocation)
     base = Path(docs) / APP_NAME
     return base
@@ -24,3 +28,9 @@ def ensure_dir(p: Path) -> Path:
 
 # Common file dialog filters
 CFG_FILTER = "Config Files (*.cfg);;All Files (*)"
+
+# File dialog options: skip custom directory icons and symlink resolution,
+# which make Qt stat every entry (slow on network mounts and big folders).
+FAST_DLG_OPTS = QFileDialog.Option.DontUseCustomDirectoryIcons | QFileDialog.Option.DontResolveSymlinks
+# getExistingDirectory defaults to ShowDirsOnly; keep it when passing options
+FAST_DIR_DLG_OPTS = FAST_DLG_OPTS | QFileDialog.Option.ShowDirsOnly
@@ -3,11 +3,12 @@ KSP-oriented presets and helpers with scalable presets.
 """
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Iterable, List
+from typing import Callable, Dict, Iterable, List, Optional
 
 from plugins.registry import Plugin
-from geometry.primitives import create_capsule, export_mesh_glb
+from geometry.primitives import create_capsule, create_capsule_batch, export_mesh_glb
 from metadata.manifest import create_for_mesh, write_sidecars
 from scale import ALL_PROFILES
 
@@ -27,6 +28,11 @@ def create_tank_glb(
     radius = float(diameter_m) / 2.0
     body_height = float(body_length_factor) * float(diameter_m)
     mesh = create_capsule(radius=radius, height=body_height, count=segments)
+    return _write_tank(mesh, output_path, diameter_m, body_length_factor, segments, scale_profile_id)
+
+
+def _write_tank(mesh, output_path: Path, diameter_m: float, body_length_factor: float, segments: int, scale_profile_id: str) -> Path:
+    """Export a tank mesh as GLB and write its sidecar manifest."""
     out_path = export_mesh_glb(mesh, Path(output_path))
     # write enhanced sidecar manifest
     bbox_min = tuple(map(float, mesh.bounds[0]))
@@ -46,26 +52,49 @@ def create_tank_glb(
     return out_path
 
 
+def tank_variant_name(diameter_m: float, body_length_factor: float) -> str:
+    """File name used for one member of a tank family."""
+    return f"tank_{diameter_m:.3f}m_L{body_length_factor:.2f}x.glb".replace("..", ".")
+
+
 def create_tank_variants_glb(
     output_dir: Path,
     diameters_m: Iterable[float],
     body_length_factors: Iterable[float],
     segments: int = 64,
     scale_profile_id: str = 'normal_m',
+    progress: Optional[Callable[[int, int], None]] = None,
 ) -> List[Path]:
     """
     Generate a whole family of tanks in one operation.
-    Returns list of created file paths.
+    Returns list of created file paths (diameter-major order).
+    progress(done, total) is called from the calling thread after each variant is written.
     """
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
-    created: List[Path] = []
-    for d in diameters_m:
-        for k in body_length_factors:
-            name = f"tank_{d:.3f}m_L{k:.2f}x.glb".replace("..", ".")
-            path = output_dir / name
-            created.append(create_tank_glb(path, diameter_m=float(d), body_length_factor=float(k), segments=segments, scale_profile_id=scale_profile_id))
-    return created
+    factors = [float(k) for k in body_length_factors]
+    # Diameter-major order: variants sharing a diameter reuse the cached cap tessellation
+    jobs = [(output_dir / tank_variant_name(d, k), float(d), k) for d in diameters_m for k in factors]
+    total = len(jobs)
+    if total <= 1:
+        created = [create_tank_glb(p, diameter_m=d, body_length_factor=k, segments=segments, scale_profile_id=scale_profile_id) for p, d, k in jobs]
+        if progress is not None and total:
+            progress(total, total)
+        return created
+    # All meshes in one batched pass (one broadcast per diameter)
+    meshes = create_capsule_batch([d / 2.0 for _, d, _ in jobs], [k * d for _, d, k in jobs], count=segments)
+    out: List[Path] = [None] * total  # type: ignore[list-item]
+    # GLB export, hashing and sidecar writes are mostly I/O; overlap them
+    with ThreadPoolExecutor(max_workers=min(8, total)) as pool:
+        futures = {
+            pool.submit(_write_tank, mesh, p, d, k, segments, scale_profile_id): i
+            for i, (mesh, (p, d, k)) in enumerate(zip(meshes, jobs))
+        }
+        for done, fut in enumerate(as_completed(futures), start=1):
+            out[futures[fut]] = fut.result()
+            if progress is not None:
+                progress(done, total)
+    return out
 
 
 def get_plugin() -> Plugin:
@@ -17,27 +17,84 @@ class Plugin:
     functions: Dict[str, Callable] = field(default_factory=dict)
 
 
+# Distributions register plugins as `name = "module:get_plugin"` in this group
+ENTRY_POINT_GROUP = 'ams.plugins'
+
+# Result of the last load_plugins() and its id index, for O(1) get_plugin_by_id
+_loaded: List[Plugin] = []
+_by_id: Dict[str, Plugin] = {}
+
+
 def load_plugins() -> List[Plugin]:
+    plugins = _discover_plugins()
+    global _loaded, _by_id
+    _loaded, _by_id = plugins, {p.plugin_id: p for p in plugins}
+    return plugins
+
+
+def invalidate_plugin_cache() -> None:
+    """Forget the id index built by the last load_plugins()."""
+    global _loaded, _by_id
+    _loaded, _by_id = [], {}
+
+
+def _entry_point_plugins() -> List[Plugin]:
+    """Plugins advertised by installed distributions under ENTRY_POINT_GROUP."""
+    plugins: List[Plugin] = []
+    try:
+        from importlib.metadata import entry_points
+        eps = entry_points(group=ENTRY_POINT_GROUP)
+    except Exception:
+        return plugins
+    for ep in eps:
+        try:
+            p = ep.load()()
+            if isinstance(p, Plugin):
+                plugins.append(p)
+        except Exception:
+            # Same policy as the package walk: a broken plugin is skipped
+            continue
+    return plugins
+
+
+def _discover_plugins() -> List[Plugin]:
+    # In-tree plugins (the suite runs from a source checkout) plus any installed
+    # through entry points; the first plugin seen for an id wins.
     plugins: List[Plugin] = []
+    seen = set()
     pkg_name = 'plugins'
     try:
         pkg = importlib.import_module(pkg_name)
     except Exception:
         return plugins
     for finder, name, ispkg in pkgutil.iter_modules(pkg.__path__, pkg_name + '.'):
+        if name == __name__:
+            continue
         try:
             mod = importlib.import_module(name)
             if hasattr(mod, 'get_plugin'):
                 p = mod.get_plugin()
-                if isinstance(p, Plugin):
+                if isinstance(p, Plugin) and p.plugin_id not in seen:
+                    seen.add(p.plugin_id)
                     plugins.append(p)
         except Exception:
             # Skip modules that fail to import; they can be fixed iteratively
             continue
+    for p in _entry_point_plugins():
+        if p.plugin_id not in seen:
+            seen.add(p.plugin_id)
+            plugins.append(p)
     return plugins
 
 
-def get_plugin_by_id(plugins: List[Plugin], plugin_id: str) -> Optional[Plugin]:
+def get_plugin_by_id(plugins: Optional[List[Plugin]], plugin_id: str) -> Optional[Plugin]:
+    """Look up a plugin by id; plugins=None means the last load_plugins() result.
+
+    Lists returned by load_plugins() are answered from the id index; other
+    lists are scanned.
+    """
+    if plugins is None or plugins is _loaded:
+        return _by_id.get(plugin_id)
     for p in plugins:
         if p.plugin_id == plugin_id:
             return p
@@ -4,14 +4,27 @@ Recipe loader and runner for JSON/YAML conversion/creation workflows.
 from __future__ import annotations
 
 import json
+import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import yaml
 from PyQt6.QtCore import QSettings
 
-from scale import get_current_profile, ALL_PROFILES
+try:
+    from yaml import CSafeLoader as _YLoader  # libyaml-backed
+except ImportError:
+    from yaml import SafeLoader as _YLoader
+
+try:
+    import msgspec  # type: ignore
+    _json_decode = msgspec.json.decode
+except ImportError:
+    _json_decode = json.loads
+
+from scale import get_current_profile, ALL_PROFILES, ScaleProfile, units_per_meter
 from plugins.preset_ksp import create_tank_glb, create_tank_variants_glb
 from converters.converters import convert_model_to_glb, convert_image
 
@@ -25,18 +38,27 @@ class StepResult:
     outputs: List[str]
 
 
-def _load_recipe_file(path: Path) -> Dict[str, Any]:
-    path = Path(path)
-    text = path.read_text(encoding="utf-8")
+@lru_cache(maxsize=32)
+def _parse_recipe(path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    # mtime_ns/size only key the cache: an edited recipe is parsed again
+    path = Path(path_str)
+    raw = path.read_bytes()
     if path.suffix.lower() in {".yaml", ".yml"}:
-        data = yaml.safe_load(text)  # type: ignore[no-any-unimported]
+        data = yaml.load(raw.decode("utf-8"), Loader=_YLoader)  # type: ignore[no-any-unimported]
     else:
-        data = json.loads(text)
+        # msgspec (when installed) decodes straight from UTF-8 bytes, no str copy
+        data = _json_decode(raw)
     if not isinstance(data, dict):
         raise ValueError("Recipe must be a JSON/YAML object at top level")
     return data
 
 
+def _load_recipe_file(path: Path) -> Dict[str, Any]:
+    """Parsed recipe, reused across runs while the file is unchanged. Treat as read-only."""
+    st = os.stat(path)
+    return _parse_recipe(str(Path(path).resolve()), st.st_mtime_ns, st.st_size)
+
+
 def _get_scale_profile(recipe: Dict[str, Any], settings: QSettings) -> str:
     pid = recipe.get("scale_profile")
     if isinstance(pid, str) and pid in ALL_PROFILES:
@@ -58,7 +80,67 @@ def _val_list_of_numbers(xs: Any, name: str) -> List[float]:
     return [float(t) for t in xs]
 
 
-def run_recipe_file(path: Path, settings: Optional[QSettings] = None) -> List[StepResult]:
+# Step handlers: (step, profile) -> (message, outputs). Errors raise and become failed steps.
+
+def _do_create_tank(step: Dict[str, Any], profile: ScaleProfile) -> Tuple[str, List[str]]:
+    out = Path(step["output"])  # raises if missing
+    diameter = _val_float(step.get("diameter"), "diameter")
+    unit = step.get("diameter_unit")
+    diameter_m = diameter / (units_per_meter(unit) if unit else profile.per_m)
+    length_factor = _val_float(step.get("length_factor", 1.0), "length_factor")
+    segments = int(step.get("segments", 128))
+    out.parent.mkdir(parents=True, exist_ok=True)
+    create_tank_glb(out, diameter_m=diameter_m, body_length_factor=length_factor, segments=segments)
+    return "ok", [str(out)]
+
+
+def _do_create_tank_family(step: Dict[str, Any], profile: ScaleProfile) -> Tuple[str, List[str]]:
+    out_dir = Path(step["output_dir"])  # raises if missing
+    diameters = _val_list_of_numbers(step.get("diameters"), "diameters")
+    unit = step.get("diameters_unit")
+    per_m = units_per_meter(unit) if unit else profile.per_m
+    if per_m != 1.0:
+        diameters = [d / per_m for d in diameters]
+    length_factors = _val_list_of_numbers(step.get("length_factors"), "length_factors")
+    segments = int(step.get("segments", 128))
+    created = create_tank_variants_glb(out_dir, diameters, length_factors, segments=segments)
+    return f"created {len(created)}", [str(p) for p in created]
+
+
+def _do_convert_model_to_glb(step: Dict[str, Any], profile: ScaleProfile) -> Tuple[str, List[str]]:
+    inp = Path(step["input"])  # raises if missing
+    out = Path(step["output"])  # raises if missing
+    convert_model_to_glb(inp, out)
+    return "ok", [str(out)]
+
+
+def _do_convert_image(step: Dict[str, Any], profile: ScaleProfile) -> Tuple[str, List[str]]:
+    inp = Path(step["input"])  # raises if missing
+    out = Path(step["output"])  # raises if missing
+    convert_image(inp, out, format=step.get("format"))
+    return "ok", [str(out)]
+
+
+_HANDLERS: Dict[str, Callable[[Dict[str, Any], ScaleProfile], Tuple[str, List[str]]]] = {
+    "create_tank": _do_create_tank,
+    "create_tank_family": _do_create_tank_family,
+    "convert_model_to_glb": _do_convert_model_to_glb,
+    "convert_image": _do_convert_image,
+}
+
+
+def run_recipe_file(
+    path: Path,
+    settings: Optional[QSettings] = None,
+    should_continue: Optional[Callable[[], bool]] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> List[StepResult]:
+    """Run every step of a recipe and return one StepResult per step run.
+
+    should_continue is checked before each step; when it returns False the
+    remaining steps are skipped and the results so far are returned.
+    progress(done, total) is called after each step.
+    """
     settings = settings or QSettings()
     recipe = _load_recipe_file(Path(path))
     pid = _get_scale_profile(recipe, settings)
@@ -69,55 +151,28 @@ def run_recipe_file(path: Path, settings: Optional[QSettings] = None) -> List[St
         raise ValueError("Recipe 'steps' must be a list")
 
     results: List[StepResult] = []
+    append = results.append
+    handlers = _HANDLERS
+
+    total = len(steps)
 
     for idx, step in enumerate(steps):
+        if should_continue is not None and not should_continue():
+            break
         if not isinstance(step, dict):
-            results.append(StepResult(idx, "<invalid>", False, "Step must be a dict", []))
-            continue
-        action = step.get("action")
-        try:
-            outputs: List[str] = []
-            if action == "create_tank":
-                out = Path(step["output"])  # raises if missing
-                diameter = _val_float(step.get("diameter"), "diameter")
-                unit = step.get("diameter_unit") or profile.unit
-                if unit == "mm":
-                    diameter_m = diameter / 1000.0
-                else:
-                    diameter_m = diameter
-                length_factor = _val_float(step.get("length_factor", 1.0), "length_factor")
-                segments = int(step.get("segments", 128))
-                out.parent.mkdir(parents=True, exist_ok=True)
-                create_tank_glb(out, diameter_m=diameter_m, body_length_factor=length_factor, segments=segments)
-                outputs.append(str(out))
-                results.append(StepResult(idx, action, True, "ok", outputs))
-            elif action == "create_tank_family":
-                out_dir = Path(step["output_dir"])  # raises if missing
-                diameters = _val_list_of_numbers(step.get("diameters"), "diameters")
-                unit = step.get("diameters_unit") or profile.unit
-                if unit == "mm":
-                    diameters = [d / 1000.0 for d in diameters]
-                length_factors = _val_list_of_numbers(step.get("length_factors"), "length_factors")
-                segments = int(step.get("segments", 128))
-                created = create_tank_variants_glb(out_dir, diameters, length_factors, segments=segments)
-                outputs.extend([str(p) for p in created])
-                results.append(StepResult(idx, action, True, f"created {len(created)}", outputs))
-            elif action == "convert_model_to_glb":
-                inp = Path(step["input"])  # raises if missing
-                out = Path(step["output"])  # raises if missing
-                convert_model_to_glb(inp, out)
-                outputs.append(str(out))
-                results.append(StepResult(idx, action, True, "ok", outputs))
-            elif action == "convert_image":
-                inp = Path(step["input"])  # raises if missing
-                out = Path(step["output"])  # raises if missing
-                fmt = step.get("format")
-                convert_image(inp, out, format=fmt)
-                outputs.append(str(out))
-                results.append(StepResult(idx, action, True, "ok", outputs))
+            append(StepResult(idx, "<invalid>", False, "Step must be a dict", []))
+        else:
+            action = step.get("action")
+            handler = handlers.get(action) if isinstance(action, str) else None
+            if handler is None:
+                append(StepResult(idx, str(action), False, "Unknown action", []))
             else:
-                results.append(StepResult(idx, str(action), False, "Unknown action", []))
-        except Exception as e:
-            results.append(StepResult(idx, str(action), False, str(e), []))
+                try:
+                    message, outputs = handler(step, profile)
+                    append(StepResult(idx, action, True, message, outputs))
+                except Exception as e:
+                    append(StepResult(idx, action, False, str(e), []))
+        if progress is not None:
+            progress(idx + 1, total)
 
     return results
@@ -3,7 +3,7 @@ Scale profiles and unit conversion utilities for metric workflows.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List
 
 from PyQt6.QtCore import QSettings
@@ -11,6 +11,14 @@ from PyQt6.QtCore import QSettings
 from paths_utils import ORG_NAME, APP_NAME
 
 
+# Units per meter; anything not listed is treated as meters
+UNITS_PER_M: Dict[str, float] = {'mm': 1000.0, 'm': 1.0}
+
+
+def units_per_meter(unit: str | None) -> float:
+    return UNITS_PER_M.get(unit, 1.0)  # type: ignore[arg-type]
+
+
 @dataclass(frozen=True)
 class ScaleProfile:
     id: str
@@ -19,16 +27,22 @@ class ScaleProfile:
     min_value: float
     max_value: float
     step: float
+    # Resolved from unit once, so conversions are a single arithmetic op
+    per_m: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, 'per_m', units_per_meter(self.unit))
+
+    @property
+    def to_m_factor(self) -> float:
+        """Multiply profile units by this to get meters (e.g. for array conversion)."""
+        return 1.0 / self.per_m
 
     def to_meters(self, value: float) -> float:
-        if self.unit == 'mm':
-            return value / 1000.0
-        return value
+        return value / self.per_m
 
     def from_meters(self, meters: float) -> float:
-        if self.unit == 'mm':
-            return meters * 1000.0
-        return meters
+        return meters * self.per_m
 
 
 SMALL_MM = ScaleProfile(
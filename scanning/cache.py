@@ -0,0 +1,95 @@
+# On-disk cache of scan_path results, invalidated by file mtime/size.
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import struct
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from paths_utils import default_workspace_root
+from scanning.scanner import scan_path
+
+# Bump when the shape of scan_path output changes
+CACHE_VERSION = 1
+_MAGIC = b"AMSC"
+_HEADER = struct.Struct("<4sI")  # magic, crc32 of payload
+
+
+def cache_dir() -> Path:
+    return default_workspace_root() / ".cache" / "scans"
+
+
+def _fingerprint(path: Path) -> Optional[tuple]:
+    """(mtime_ns, size) for a file; for a folder, a digest over every file's relpath/mtime/size."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if not path.is_dir():
+        return (st.st_mtime_ns, st.st_size)
+    # Folder mtimes miss edits to nested files, so stat the whole tree (no reads)
+    h = hashlib.blake2b(digest_size=16)
+    for dirpath, dirnames, filenames in os.walk(path):
+        dirnames.sort()
+        for name in sorted(filenames):
+            full = os.path.join(dirpath, name)
+            try:
+                fst = os.stat(full)
+            except OSError:
+                continue
+            h.update(f"{os.path.relpath(full, path)}\0{fst.st_mtime_ns}\0{fst.st_size}\n".encode("utf-8", "surrogateescape"))
+    return ("dir", h.hexdigest())
+
+
+def _entry_path(key: str) -> Path:
+    return cache_dir() / (hashlib.sha1(key.encode("utf-8", "surrogateescape")).hexdigest() + ".pkl")
+
+
+def _read_entry(entry: Path) -> Optional[Dict[str, Any]]:
+    try:
+        blob = entry.read_bytes()
+    except OSError:
+        return None
+    if len(blob) < _HEADER.size:
+        return None
+    magic, crc = _HEADER.unpack_from(blob)
+    payload = memoryview(blob)[_HEADER.size:]
+    if magic != _MAGIC or zlib.crc32(payload) != crc:
+        return None
+    try:
+        return pickle.loads(payload)
+    except Exception:
+        return None
+
+
+def _write_entry(entry: Path, record: Dict[str, Any]) -> None:
+    payload = pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)
+    entry.parent.mkdir(parents=True, exist_ok=True)
+    tmp = entry.with_name(entry.name + ".tmp")
+    tmp.write_bytes(_HEADER.pack(_MAGIC, zlib.crc32(payload)) + payload)
+    os.replace(tmp, entry)
+
+
+def get_or_compute(path: Path, progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
+    """scan_path(path), served from the on-disk cache while the file (or tree) is unchanged.
+
+    progress is passed to scan_path on a miss.
+    """
+    path = Path(path)
+    key = str(path.resolve())
+    fp = _fingerprint(path)
+    entry = _entry_path(key)
+    if fp is not None:
+        rec = _read_entry(entry)
+        if rec and rec.get("version") == CACHE_VERSION and rec.get("key") == key and rec.get("fingerprint") == fp:
+            return rec["data"]
+    data = scan_path(path, progress=progress)
+    if fp is not None:
+        try:
+            _write_entry(entry, {"version": CACHE_VERSION, "key": key, "fingerprint": fp, "data": data})
+        except OSError:
+            pass  # caching is best-effort
+    return data
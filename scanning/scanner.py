@@ -2,14 +2,18 @@
 from __future__ import annotations
 
 import json
+import logging
+import os
+import stat
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-import hashlib
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
 try:
     import yaml  # type: ignore
+    _YLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)  # libyaml when available
 except Exception:
     yaml = None
 
@@ -18,6 +22,9 @@ from PIL import Image
 
 from scale import get_current_profile
 from metadata.manifest import create_for_mesh, create_for_file, write_sidecars
+from metadata.utils import sha256_file
+
+log = logging.getLogger(__name__)
 
 
 @dataclass
@@ -34,47 +41,101 @@ TEXT_EXTS = {".cfg", ".ini", ".txt", ".json", ".yaml", ".yml", ".xml"}
 
 
 def _sha256_file(p: Path) -> str:
-    h = hashlib.sha256()
-    with open(p, "rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
-    return h.hexdigest()
+    # mmap / hashlib.file_digest: the read+update loop stays in C
+    return sha256_file(p)
+
+
+def _probe_model(path_str: str) -> Optional[Dict[str, Any]]:
+    """Load a model and return its bbox/counts as plain values (None if it won't load).
+
+    Module-level and free of mesh objects so it can run in a worker process.
+    """
+    try:
+        mesh = trimesh.load(path_str, force="mesh")
+        if mesh is None:
+            return None
+        return {
+            "bbox_min": tuple(map(float, mesh.bounds[0])),
+            "bbox_max": tuple(map(float, mesh.bounds[1])),
+            "vertices": int(mesh.vertices.shape[0]) if hasattr(mesh, 'vertices') else None,
+            "faces": int(mesh.faces.shape[0]) if hasattr(mesh, 'faces') else None,
+        }
+    except Exception:
+        return None
+
+
+_UNPROBED = object()
 
 
-def scan_file(path: Path) -> ScanResult:
+def _from_sidecar(path: Path, st: os.stat_result) -> Optional[ScanResult]:
+    """ScanResult recorded in path's .ams.json audit, if it still matches path's size/mtime."""
+    try:
+        with open(str(path) + ".ams.json", "rb") as f:
+            audit = json.loads(f.read()).get("audit")
+        details = audit["details"]
+        if (
+            audit.get("kind") != "file"
+            or details.get("size_bytes") != st.st_size
+            or details.get("mtime_ns") != st.st_mtime_ns
+            or not details.get("sha256")  # audits from scans that skipped the hash
+        ):
+            return None
+        details = dict(details)
+        for key in ("bbox_min", "bbox_max"):
+            if isinstance(details.get(key), list):
+                details[key] = tuple(details[key])  # JSON turned the tuples into lists
+        return ScanResult(path=path, detected_type=audit["detected_type"], details=details, missing=list(audit.get("missing") or []))
+    except Exception:
+        return None  # no sidecar, an older one without mtime_ns, or unreadable
+
+
+def scan_file(
+    path: Path,
+    model_details: Any = _UNPROBED,
+    use_sidecar: bool = True,
+    st: Optional[os.stat_result] = None,
+) -> ScanResult:
+    """Scan one file. model_details takes a precomputed _probe_model result for model files,
+    st an already-known stat of path.
+
+    With use_sidecar, an unchanged file (same size and mtime_ns as recorded in its
+    .ams.json audit) returns the recorded result without hashing or parsing.
+    """
     path = Path(path)
     ext = path.suffix.lower()
     details: Dict[str, Any] = {}
     missing: List[str] = []
 
     try:
-        size = path.stat().st_size
+        if st is None:
+            st = path.stat()
+        size = st.st_size
+        is_file = stat.S_ISREG(st.st_mode)
     except Exception:
         size = 0
+        is_file = False
+    if is_file and use_sidecar:
+        cached = _from_sidecar(path, st)
+        if cached is not None:
+            return cached
     details["size_bytes"] = size
-    details["sha256"] = _sha256_file(path) if path.is_file() else None
+    if is_file:
+        details["mtime_ns"] = st.st_mtime_ns  # lets a later scan reuse the sidecar
+    details["sha256"] = _sha256_file(path) if is_file else None
 
     if ext in MODEL_EXTS:
-        try:
-            mesh = trimesh.load(path, force="mesh")
-            if mesh is None:
-                raise ValueError("No mesh")
-            bbox_min = tuple(map(float, mesh.bounds[0]))
-            bbox_max = tuple(map(float, mesh.bounds[1]))
-            details.update({
-                "bbox_min": bbox_min,
-                "bbox_max": bbox_max,
-                "vertices": int(mesh.vertices.shape[0]) if hasattr(mesh, 'vertices') else None,
-                "faces": int(mesh.faces.shape[0]) if hasattr(mesh, 'faces') else None,
-            })
+        probed = _probe_model(str(path)) if model_details is _UNPROBED else model_details
+        if probed is None:
+            detected = "binary"
+        else:
+            details.update(probed)
             # Potential missing items to track later
             if details.get("faces") is None:
                 missing.append("faces")
             detected = "model"
-        except Exception:
-            detected = "binary"
     elif ext in IMAGE_EXTS:
         try:
+            # Image.open only parses the header; size/mode/format never touch pixel data
             with Image.open(path) as im:
                 details.update({
                     "width": int(im.width),
@@ -97,7 +158,7 @@ def scan_file(path: Path) -> ScanResult:
             except Exception:
                 if yaml:
                     try:
-                        yaml.safe_load(text)
+                        yaml.load(text, Loader=_YLoader)
                         kind = "yaml"
                     except Exception:
                         pass
@@ -110,16 +171,124 @@ def scan_file(path: Path) -> ScanResult:
     return ScanResult(path=path, detected_type=detected, details=details, missing=missing)
 
 
-def scan_path(path: Path) -> Dict[str, Any]:
+def scan_file_from_entry(entry: os.DirEntry, **kwargs: Any) -> ScanResult:
+    """scan_file for a directory entry, reusing the stat the entry caches."""
+    try:
+        st = entry.stat()
+    except OSError:
+        st = None
+    return scan_file(entry.path, st=st, **kwargs)
+
+
+def _sidecar_hit(entry: os.DirEntry) -> Optional[ScanResult]:
+    """_from_sidecar for a directory entry; None on a miss or a stat error."""
+    try:
+        return _from_sidecar(Path(entry.path), entry.stat())
+    except OSError:
+        return None
+
+
+def _iter_files(root: str) -> Iterator[os.DirEntry]:
+    """Every file under root, like rglob('*') + is_file(): symlinked files are
+    yielded, symlinked directories are not descended into."""
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+                except OSError:
+                    continue
+
+
+# scan_file is I/O bound (reads, hashing, trimesh/PIL decoding release the GIL)
+SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# Model parsing is mostly Python-level (GIL-bound), so big model sets are probed in
+# worker processes. max_tasks_per_child (Python 3.11+) forces spawn, and each child re-imports
+# trimesh/PyQt6 (~1 s), so the pool is only used for at least this many models
+# totalling at least this many bytes.
+MODEL_PROCESS_MIN = 8
+MODEL_PROCESS_MIN_BYTES = 64 * 1024 * 1024
+_MODEL_TASKS_PER_CHILD = 16  # recycle workers to cap memory growth from big meshes
+
+
+def _probe_models(models: List[str], total_bytes: int) -> Dict[str, Optional[Dict[str, Any]]]:
+    """_probe_model over models in a process pool when the set is big enough.
+
+    Returns {} otherwise (or if the pool fails); scan_file then probes in-thread.
+    """
+    if len(models) < MODEL_PROCESS_MIN or total_bytes < MODEL_PROCESS_MIN_BYTES:
+        return {}
+    pool_kwargs: Dict[str, Any] = {'max_workers': min(os.cpu_count() or 1, len(models))}
+    if sys.version_info >= (3, 11):
+        pool_kwargs['max_tasks_per_child'] = _MODEL_TASKS_PER_CHILD
+    probed: Dict[str, Optional[Dict[str, Any]]] = {}
+    try:
+        with ProcessPoolExecutor(**pool_kwargs) as ex:
+            for p, info in zip(models, ex.map(_probe_model, models, chunksize=1)):
+                probed[p] = info
+    except Exception:
+        # Pool unavailable (e.g. frozen/sandboxed); whatever is missing gets probed in-thread
+        log.warning("Model probe pool failed; probing %d model(s) serially", len(models) - len(probed), exc_info=True)
+    return probed
+
+
+def scan_path(path: Path, progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
+    """Scan a file, or every file under a folder in parallel.
+
+    progress(done, total) is called from the calling thread after each file of a folder scan.
+    """
     path = Path(path)
     if path.is_dir():
+        # scandir entries: no Path per walked entry, and the stat is reused by scan_file
+        files = list(_iter_files(str(path)))
+        total = len(files)
         results: List[ScanResult] = []
-        for p in path.rglob("*"):
-            if p.is_file():
+        if files:
+            # Models whose sidecar audit is current are answered before anything is
+            # probed; only the misses go to the (process-pool) model probe
+            models = [e for e in files if os.path.splitext(e.name)[1].lower() in MODEL_EXTS]
+            hits: Dict[str, ScanResult] = {}
+            for e in models:
+                hit = _sidecar_hit(e)
+                if hit is not None:
+                    hits[e.path] = hit
+            results.extend(hits.values())
+            misses = [e for e in models if e.path not in hits]
+            miss_bytes = 0
+            for e in misses:
                 try:
-                    results.append(scan_file(p))
-                except Exception:
+                    miss_bytes += e.stat().st_size
+                except OSError:
                     pass
+            probed = _probe_models([e.path for e in misses], miss_bytes)
+            model_misses = {e.path for e in misses}
+            pending = [e for e in files if e.path not in hits]
+            if hits and progress is not None:
+                progress(len(hits), total)
+            with ThreadPoolExecutor(max_workers=max(1, min(SCAN_WORKERS, len(pending)))) as ex:
+                futures = []
+                for e in pending:
+                    kwargs: Dict[str, Any] = {}
+                    if e.path in model_misses:
+                        kwargs["use_sidecar"] = False  # already checked above
+                    if e.path in probed:
+                        kwargs["model_details"] = probed[e.path]
+                    futures.append(ex.submit(scan_file_from_entry, e, **kwargs))
+                for done, fut in enumerate(as_completed(futures), start=len(hits) + 1):
+                    try:
+                        results.append(fut.result())
+                    except Exception:
+                        pass
+                    if progress is not None:
+                        progress(done, total)
         summary = {
             "files": len(results),
             "models": sum(1 for r in results if r.detected_type == "model"),
@@ -139,10 +308,14 @@ def scan_path(path: Path) -> Dict[str, Any]:
         }
 
 
-def write_sidecar_from_scan(path: Path) -> Optional[Path]:
-    """Create or update an AMS sidecar using scan results. Returns JSON sidecar path."""
+def write_sidecar_from_scan(path: Path, data: Optional[Dict[str, Any]] = None) -> Optional[Path]:
+    """Create or update an AMS sidecar using scan results. Returns JSON sidecar path.
+
+    Pass data when scan_path(path) output is already at hand to skip a rescan.
+    """
     path = Path(path)
-    data = scan_path(path)
+    if data is None:
+        data = scan_path(path)
     sp = get_current_profile()
 
     if data["kind"] == "file":
@@ -2,11 +2,18 @@
 from __future__ import annotations
 
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
 from jsonschema import Draft7Validator, RefResolver, validate, exceptions as js_exceptions
 
+try:
+    import ijson  # type: ignore  # optional: incremental parsing for large JSON arrays
+except ImportError:
+    ijson = None
+
 
 def _load_json_file(path: Path) -> Dict[str, Any]:
     with open(path, 'r', encoding='utf-8') as f:
@@ -29,22 +36,75 @@ def _preprocess_inherits(doc: Dict[str, Any], base_dir: Path) -> Dict[str, Any]:
     return doc
 
 
-def load_validator(schema_path: str | Path) -> Draft7Validator:
-    schema_path = Path(schema_path).resolve()
+@lru_cache(maxsize=64)
+def _cached_validator(path_str: str, mtime_ns: int, size: int) -> Draft7Validator:
+    # mtime_ns/size only key the cache: editing the schema file builds a new validator,
+    # and the bounded LRU drops validators for superseded versions
+    schema_path = Path(path_str)
     raw = _load_json_file(schema_path)
     pre = _preprocess_inherits(raw, schema_path.parent)
     resolver = RefResolver(base_uri=schema_path.parent.as_uri() + '/', referrer=pre)
     try:
-        validator = Draft7Validator(pre, resolver=resolver)
+        validator = Draft7Validator(pre, resolver=resolver, format_checker=None)
     except js_exceptions.SchemaError as e:
         raise RuntimeError(f"Invalid schema at {schema_path}: {e}") from e
     return validator
 
 
-def validate_document(document: Dict[str, Any], schema_path: str | Path) -> list[str]:
-    validator = load_validator(schema_path)
+def load_validator(schema_path: str | Path) -> Draft7Validator:
+    schema_path = Path(schema_path).resolve()
+    st = os.stat(schema_path)
+    return _cached_validator(str(schema_path), st.st_mtime_ns, st.st_size)
+
+
+def _format_errors(validator: Draft7Validator, instance: Any, prefix: str = "") -> list[str]:
     errors: list[str] = []
-    for error in sorted(validator.iter_errors(document), key=lambda e: e.path):
+    for error in sorted(validator.iter_errors(instance), key=lambda e: e.path):
         loc = "/".join(map(str, error.path))
+        if prefix:
+            loc = f"{prefix}/{loc}" if loc else prefix
         errors.append(f"{loc or '<root>'}: {error.message}")
     return errors
+
+
+def validate_document(document: Dict[str, Any], schema_path: str | Path) -> list[str]:
+    validator = load_validator(schema_path)
+    return _format_errors(validator, document)
+
+
+# An array schema made of only these keys is fully checked by validating each item
+_STREAMABLE_ARRAY_KEYS = {"$schema", "$id", "$comment", "title", "description", "type", "items", "definitions"}
+
+
+def _items_validator(validator: Draft7Validator) -> Draft7Validator | None:
+    schema = validator.schema
+    if not isinstance(schema, dict) or schema.get("type") != "array":
+        return None
+    if not isinstance(schema.get("items"), dict) or not set(schema) <= _STREAMABLE_ARRAY_KEYS:
+        return None
+    return Draft7Validator(schema["items"], resolver=validator.resolver, format_checker=None)
+
+
+def _starts_with_array(path: Path) -> bool:
+    with open(path, 'rb') as f:
+        head = f.read(64).lstrip(b"\xef\xbb\xbf \t\r\n")
+    return head.startswith(b"[")
+
+
+def validate_document_stream(json_path: str | Path, schema_path: str | Path) -> list[str]:
+    """Validate a JSON file, streaming it record by record when possible.
+
+    For an "array of records" schema and a top-level JSON array, items are parsed
+    and checked one at a time with ijson, so memory stays O(one record). Any other
+    schema/document (or no ijson) is loaded whole and checked with validate_document.
+    """
+    json_path = Path(json_path)
+    validator = load_validator(schema_path)
+    items_validator = _items_validator(validator) if ijson is not None else None
+    if items_validator is None or not _starts_with_array(json_path):
+        return _format_errors(validator, _load_json_file(json_path))
+    errors: list[str] = []
+    with open(json_path, 'rb') as f:
+        for idx, record in enumerate(ijson.items(f, 'item', use_float=True)):
+            errors.extend(_format_errors(items_validator, record, prefix=str(idx)))
+    return errors
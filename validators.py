@@ -9,7 +9,12 @@ from enum import Enum
 from pathlib import Path
 import re
 import string
-from typing import List, Optional
+from typing import Callable, Iterable, Iterator, List, Optional
+
+# Compiled once at import and shared by every rule instance.
+# Non-printable: anything outside string.printable (already includes \t \n \r)
+_NONPRINT_RE = re.compile("[^" + re.escape(string.printable) + "]")
+_KEY_RE = re.compile(r"\s*([A-Za-z0-9_.-]+)\s*=")
 
 
 class Severity(Enum):
@@ -29,6 +34,7 @@ class ValidationIssue:
 @dataclass
 class ValidationResult:
     issues: List[ValidationIssue] = field(default_factory=list)
+    cancelled: bool = False  # validation stopped early; issues are partial
 
     @property
     def is_ok(self) -> bool:
@@ -40,13 +46,20 @@ class ValidationResult:
     def extend(self, issues: List[ValidationIssue]) -> None:
         self.issues.extend(issues)
 
-    def as_text(self) -> str:
+    def as_text(self, max_chars: Optional[int] = None) -> str:
+        """Render issues one per line. With max_chars, stop formatting once the
+        limit is crossed and cut there with a '... (truncated)' marker."""
         if not self.issues:
             return "No issues found."
         lines = []
+        total = -1  # no newline before the first line
         for i in self.issues:
             loc = f" (line {i.line})" if i.line is not None else ""
-            lines.append(f"[{i.severity.value}] {i.rule_id}{loc}: {i.message}")
+            line = f"[{i.severity.value}] {i.rule_id}{loc}: {i.message}"
+            lines.append(line)
+            total += len(line) + 1
+            if max_chars is not None and total > max_chars:
+                return "\n".join(lines)[:max_chars] + "\n... (truncated)"
         return "\n".join(lines)
 
 
@@ -57,6 +70,20 @@ class BaseRule:
         return []
 
 
+class PerLineRule(BaseRule):
+    """Rule that only looks at individual lines.
+
+    CfgValidator splits the text once and hands the same line list to every
+    such rule; check() stays available for standalone use.
+    """
+
+    def check(self, text: str) -> List[ValidationIssue]:
+        return self.check_lines(text.splitlines())
+
+    def check_lines(self, lines: List[str]) -> List[ValidationIssue]:  # pragma: no cover - interface
+        return []
+
+
 class RuleNonEmptyFile(BaseRule):
     rule_id = "non_empty_file"
 
@@ -75,14 +102,14 @@ class RuleNoNullBytes(BaseRule):
         return []
 
 
-class RuleNoNonPrintable(BaseRule):
+class RuleNoNonPrintable(PerLineRule):
     rule_id = "no_non_printable"
 
-    def check(self, text: str) -> List[ValidationIssue]:
-        printable = set(string.printable) | {"\t", "\n", "\r"}
+    def check_lines(self, lines: List[str]) -> List[ValidationIssue]:
         issues: List[ValidationIssue] = []
-        for idx, line in enumerate(text.splitlines(), start=1):
-            bad = [ch for ch in line if ch not in printable]
+        find_bad = _NONPRINT_RE.findall
+        for idx, line in enumerate(lines, start=1):
+            bad = find_bad(line)
             if bad:
                 issues.append(
                     ValidationIssue(
@@ -95,15 +122,15 @@ class RuleNoNonPrintable(BaseRule):
         return issues
 
 
-class RuleMaxLineLength(BaseRule):
+class RuleMaxLineLength(PerLineRule):
     rule_id = "max_line_length"
 
     def __init__(self, max_len: int = 200) -> None:
         self.max_len = max_len
 
-    def check(self, text: str) -> List[ValidationIssue]:
+    def check_lines(self, lines: List[str]) -> List[ValidationIssue]:
         issues: List[ValidationIssue] = []
-        for idx, line in enumerate(text.splitlines(), start=1):
+        for idx, line in enumerate(lines, start=1):
             if len(line) > self.max_len:
                 issues.append(
                     ValidationIssue(
@@ -116,17 +143,16 @@ class RuleMaxLineLength(BaseRule):
         return issues
 
 
-class RuleIniDuplicateKeys(BaseRule):
+class RuleIniDuplicateKeys(PerLineRule):
     rule_id = "ini_duplicate_keys"
 
-    def check(self, text: str) -> List[ValidationIssue]:
+    def check_lines(self, lines: List[str]) -> List[ValidationIssue]:
         issues: List[ValidationIssue] = []
         seen = set()
-        key_re = re.compile(r"^\s*([A-Za-z0-9_.-]+)\s*=\s*.*$")
-        for idx, line in enumerate(text.splitlines(), start=1):
-            if line.strip().startswith(('#', ';')):
-                continue
-            m = key_re.match(line)
+        # Comment lines ('#', ';') can't match: the key must be the first non-blank text
+        match_key = _KEY_RE.match
+        for idx, line in enumerate(lines, start=1):
+            m = match_key(line)
             if not m:
                 continue
             key = m.group(1).lower()
@@ -137,18 +163,21 @@ class RuleIniDuplicateKeys(BaseRule):
         return issues
 
 
-class RuleBalancedBrackets(BaseRule):
+class RuleBalancedBrackets(PerLineRule):
     rule_id = "balanced_brackets"
 
     pairs = {')': '(', ']': '[', '}': '{'}
     opens = set(pairs.values())
     closes = set(pairs.keys())
+    _bracket_re = re.compile(r"[(){}\[\]]")
 
-    def check(self, text: str) -> List[ValidationIssue]:
+    def check_lines(self, lines: List[str]) -> List[ValidationIssue]:
         stack: List[tuple[str, int]] = []  # (char, line)
         issues: List[ValidationIssue] = []
-        for idx, line in enumerate(text.splitlines(), start=1):
-            for ch in line:
+        find_brackets = self._bracket_re.findall
+        for idx, line in enumerate(lines, start=1):
+            # Only the bracket characters; the regex skips the rest in C
+            for ch in find_brackets(line):
                 if ch in self.opens:
                     stack.append((ch, idx))
                 elif ch in self.closes:
@@ -161,6 +190,22 @@ class RuleBalancedBrackets(BaseRule):
         return issues
 
 
+class ValidationCancelled(Exception):
+    pass
+
+
+# Lines between should_continue() polls during CfgValidator.validate
+CANCEL_CHECK_LINES = 1024
+
+
+def _polled(lines: List[str], should_continue: Callable[[], bool]) -> Iterator[str]:
+    """Yield lines, polling should_continue() every CANCEL_CHECK_LINES."""
+    for start in range(0, len(lines), CANCEL_CHECK_LINES):
+        if not should_continue():
+            raise ValidationCancelled()
+        yield from lines[start:start + CANCEL_CHECK_LINES]
+
+
 class CfgValidator:
     """Composite validator applying a curated set of rules suitable for generic CFG/text files."""
 
@@ -174,8 +219,26 @@ class CfgValidator:
             RuleBalancedBrackets(),
         ]
 
-    def validate(self, text: str) -> ValidationResult:
+    def validate(self, text: str, should_continue: Optional[Callable[[], bool]] = None) -> ValidationResult:
+        """Run every rule over text.
+
+        should_continue is polled before each rule and every CANCEL_CHECK_LINES
+        lines within per-line rules; once it returns False, validation stops and
+        the result (issues of the rules that completed) has cancelled=True.
+        """
         result = ValidationResult()
+        lines = text.splitlines()  # once, shared by every per-line rule
         for rule in self.rules:
-            result.extend(rule.check(text))
+            if should_continue is not None and not should_continue():
+                result.cancelled = True
+                break
+            if isinstance(rule, PerLineRule):
+                rule_lines: Iterable[str] = lines if should_continue is None else _polled(lines, should_continue)
+                try:
+                    result.extend(rule.check_lines(rule_lines))  # type: ignore[arg-type]
+                except ValidationCancelled:
+                    result.cancelled = True
+                    break
+            else:
+                result.extend(rule.check(text))
         return result
@@ -3,16 +3,16 @@ Background workers for long-running tasks to keep the UI responsive.
 """
 from __future__ import annotations
 
-from PyQt6.QtCore import QObject, QThread, pyqtSignal
-from typing import Optional, List
+from PyQt6.QtCore import QIODevice, QObject, QRunnable, QSaveFile, QThread, QThreadPool, pyqtSignal
+from typing import Optional, List, Sequence
 from pathlib import Path
 
 from validators import CfgValidator, ValidationResult
-from recipes.runner import run_recipe_file, StepResult
 
 
 class ValidationWorker(QObject):
     finished = pyqtSignal(object)  # emits ValidationResult
+    cancelled = pyqtSignal(object)  # emits the partial ValidationResult
     error = pyqtSignal(str)
     progress = pyqtSignal(int)
 
@@ -20,23 +20,107 @@ class ValidationWorker(QObject):
         super().__init__()
         self._text = text
         self._max_len = max_line_length
+        self._cancel = False
+
+    def cancel(self) -> None:
+        """Ask a running validation to stop; safe to call from any thread."""
+        self._cancel = True  # a plain attribute store is atomic under the GIL
 
     def run(self) -> None:
         try:
             validator = CfgValidator(max_line_length=self._max_len)
-            result: ValidationResult = validator.validate(self._text)
-            self.finished.emit(result)
+            result: ValidationResult = validator.validate(self._text, should_continue=lambda: not self._cancel)
+            (self.cancelled if result.cancelled else self.finished).emit(result)
         except Exception as e:  # pragma: no cover - defensive
             self.error.emit(str(e))
 
 
-def run_validation_in_thread(text: str, max_line_length: int = 200):
-    """Utility to create a thread+worker pair configured for validation.
+class WorkerRunnable(QRunnable):
+    """Runs a worker's run() on a QThreadPool thread; the worker only bridges signals.
 
-    Returns (thread, worker) with connections left to the caller.
+    Short jobs that may be fired in bulk use this instead of a QThread each: pool
+    threads are reused and nothing needs moveToThread or quitting.
+    """
+
+    def __init__(self, worker: QObject) -> None:
+        super().__init__()
+        self._worker = worker  # kept alive until run() returns
+        self.setAutoDelete(True)
+
+    def run(self) -> None:
+        self._worker.run()
+
+    def start(self, pool: Optional[QThreadPool] = None) -> None:
+        (pool or QThreadPool.globalInstance()).start(self)
+
+
+def run_validation_in_pool(text: str, max_line_length: int = 200):
+    """Create a pooled validation job.
+
+    Returns (runnable, worker): connect the worker's signals, then runnable.start().
+    The caller keeps a reference to the worker until it reports back.
     """
-    thread = QThread()
     worker = ValidationWorker(text=text, max_line_length=max_line_length)
+    return WorkerRunnable(worker), worker
+
+
+class FileReadWorker(QObject):
+    finished = pyqtSignal(str)  # emits file text
+    error = pyqtSignal(str)
+
+    def __init__(self, path: Path, encoding: str = "utf-8") -> None:
+        super().__init__()
+        self._path = Path(path)
+        self._encoding = encoding
+
+    def run(self) -> None:
+        try:
+            self.finished.emit(self._path.read_text(encoding=self._encoding))
+        except Exception as e:
+            self.error.emit(str(e))
+
+
+def run_file_read_in_thread(path: Path, encoding: str = "utf-8"):
+    """Read a text file off the GUI thread. Returns (thread, worker) with connections left to the caller."""
+    thread = QThread()
+    worker = FileReadWorker(path=path, encoding=encoding)
+    worker.moveToThread(thread)
+    thread.started.connect(worker.run)
+    return thread, worker
+
+
+class FileWriteWorker(QObject):
+    finished = pyqtSignal(str)  # emits the written path
+    error = pyqtSignal(str)
+
+    def __init__(self, path: Path, text: str, encoding: str = "utf-8") -> None:
+        super().__init__()
+        self._path = Path(path)
+        self._text = text
+        self._encoding = encoding
+
+    def run(self) -> None:
+        # QSaveFile writes a temp file and renames it over the target on commit():
+        # a crash never leaves a half-written file, and permissions are kept.
+        try:
+            f = QSaveFile(str(self._path))
+            # Text mode: '\n' becomes the platform line ending, as with write_text
+            if not f.open(QIODevice.OpenModeFlag.WriteOnly | QIODevice.OpenModeFlag.Text):
+                raise OSError(f.errorString())
+            data = self._text.encode(self._encoding)
+            if f.write(data) != len(data):
+                raise OSError(f.errorString())  # uncommitted: the temp file is discarded
+            if not f.commit():
+                raise OSError(f.errorString())
+            self.finished.emit(str(self._path))
+        except Exception as e:
+            self.error.emit(str(e))
+
+
+def run_file_write_in_thread(path: Path, text: str, encoding: str = "utf-8"):
+    """Write a text file off the GUI thread. Returns (thread, worker)."""
+    thread = QThread()
+    worker = FileWriteWorker(path=path, text=text, encoding=encoding)
     worker.moveToThread(thread)
     thread.started.connect(worker.run)
     return thread, worker
@@ -44,23 +128,124 @@ def run_validation_in_thread(text: str, max_line_length: int = 200):
 
 class RecipeWorker(QObject):
     finished = pyqtSignal(object)  # emits List[StepResult]
+    cancelled = pyqtSignal(object)  # emits the results of the steps run before cancel()
     error = pyqtSignal(str)
+    progress = pyqtSignal(int, int)  # steps done, total
 
     def __init__(self, file_path: str) -> None:
         super().__init__()
         self._file_path = file_path
+        self._cancel = False
+
+    def cancel(self) -> None:
+        """Skip the remaining steps (the one running finishes); safe from any thread."""
+        self._cancel = True
 
     def run(self) -> None:
         try:
-            results: List[StepResult] = run_recipe_file(Path(self._file_path))  # type: ignore[name-defined]
-            self.finished.emit(results)
+            from recipes.runner import run_recipe_file, StepResult  # deferred: pulls in trimesh/PIL
+            skipped = False
+
+            def should_continue() -> bool:
+                # Only polled before a step, so this records that steps were actually skipped;
+                # a cancel() arriving after the last step still reports finished
+                nonlocal skipped
+                skipped = self._cancel
+                return not skipped
+
+            results: List[StepResult] = run_recipe_file(  # type: ignore[name-defined]
+                Path(self._file_path),
+                should_continue=should_continue,
+                progress=self.progress.emit,
+            )
+            (self.cancelled if skipped else self.finished).emit(results)
         except Exception as e:  # pragma: no cover - defensive
             self.error.emit(str(e))
 
 
-def run_recipe_in_thread(file_path: str):
-    thread = QThread()
+def run_recipe_in_pool(file_path: str):
+    """Create a pooled recipe job. Returns (runnable, worker) like run_validation_in_pool."""
     worker = RecipeWorker(file_path=file_path)
+    return WorkerRunnable(worker), worker
+
+
+class TankFamilyWorker(QObject):
+    finished = pyqtSignal(object)  # emits List[Path], in diameter-major order
+    error = pyqtSignal(str)
+    progress = pyqtSignal(int, int)  # done, total
+
+    def __init__(
+        self,
+        output_dir: Path,
+        diameters_m: Sequence[float],
+        body_length_factors: Sequence[float],
+        segments: int,
+        scale_profile_id: str,
+    ) -> None:
+        super().__init__()
+        self._output_dir = Path(output_dir)
+        self._diameters = [float(d) for d in diameters_m]
+        self._factors = [float(k) for k in body_length_factors]
+        self._segments = segments
+        self._profile_id = scale_profile_id
+
+    def run(self) -> None:
+        try:
+            # Same batched path as recipes: one NumPy pass builds every mesh, and
+            # export/sidecar I/O overlaps on threads (no fork of the GUI process)
+            from plugins.preset_ksp import create_tank_variants_glb
+            created = create_tank_variants_glb(
+                self._output_dir,
+                self._diameters,
+                self._factors,
+                segments=self._segments,
+                scale_profile_id=self._profile_id,
+                progress=self.progress.emit,
+            )
+            self.finished.emit(created)
+        except Exception as e:
+            self.error.emit(str(e))
+
+
+def run_tank_family_in_pool(
+    output_dir: Path,
+    diameters_m: Sequence[float],
+    body_length_factors: Sequence[float],
+    segments: int = 64,
+    scale_profile_id: str = 'normal_m',
+):
+    """Generate a tank family (create_tank_variants_glb) driven from a QThread.
+
+    Returns (thread, worker); progress(done, total) fires per finished variant.
+    """
+    thread = QThread()
+    worker = TankFamilyWorker(output_dir, diameters_m, body_length_factors, segments, scale_profile_id)
+    worker.moveToThread(thread)
+    thread.started.connect(worker.run)
+    return thread, worker
+
+
+class ScanWorker(QObject):
+    finished = pyqtSignal(object)  # emits the scan_path dict
+    error = pyqtSignal(str)
+    progress = pyqtSignal(int, int)  # done, total (folder scans)
+
+    def __init__(self, path: Path) -> None:
+        super().__init__()
+        self._path = Path(path)
+
+    def run(self) -> None:
+        try:
+            from scanning.cache import get_or_compute
+            self.finished.emit(get_or_compute(self._path, progress=self.progress.emit))
+        except Exception as e:
+            self.error.emit(str(e))
+
+
+def run_scan_in_thread(path: Path):
+    """Scan a file or folder (through the scan cache) off the GUI thread. Returns (thread, worker)."""
+    thread = QThread()
+    worker = ScanWorker(path)
     worker.moveToThread(thread)
     thread.started.connect(worker.run)
     return thread, worker